@@ -2,13 +2,25 @@
 Application configuration from environment variables.
 """
 
-from functools import lru_cache
-from typing import List
+import os
+from dataclasses import dataclass, field
+from typing import Final, Tuple
 
-from pydantic_settings import BaseSettings
+from dotenv import load_dotenv
 
+# Load .env once at import; real environment variables take precedence.
+load_dotenv(override=False)
 
-class Settings(BaseSettings):
+
+def _env_bool(key: str, default: bool) -> bool:
+    raw = os.environ.get(key)
+    if raw is None:
+        return default
+    return raw.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """Application settings loaded from environment variables."""
 
     # Database
@@ -41,18 +53,45 @@ class Settings(BaseSettings):
     port: int = 8000
     debug: bool = False
 
-    @property
-    def cors_origins(self) -> List[str]:
-        """Parse CORS origins from comma-separated string."""
-        return [origin.strip() for origin in self.allowed_origins.split(",")]
+    # Derived: CORS origins pre-split once at construction
+    cors_origins: Tuple[str, ...] = field(default=(), init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "cors_origins",
+            tuple(origin.strip() for origin in self.allowed_origins.split(",")),
+        )
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from os.environ, falling back to field defaults."""
+        defaults = cls()
+        return cls(
+            database_url=os.environ.get("DATABASE_URL", defaults.database_url),
+            redis_url=os.environ.get("REDIS_URL", defaults.redis_url),
+            anthropic_api_key=os.environ.get("ANTHROPIC_API_KEY", ""),
+            google_api_key=os.environ.get("GOOGLE_API_KEY", ""),
+            admin_api_key=os.environ.get("ADMIN_API_KEY", defaults.admin_api_key),
+            resend_api_key=os.environ.get("RESEND_API_KEY", ""),
+            email_from=os.environ.get("EMAIL_FROM", ""),
+            allowed_origins=os.environ.get("ALLOWED_ORIGINS", defaults.allowed_origins),
+            whisper_model=os.environ.get("WHISPER_MODEL", defaults.whisper_model),
+            host=os.environ.get("HOST", defaults.host),
+            port=int(os.environ.get("PORT", defaults.port)),
+            debug=_env_bool("DEBUG", defaults.debug),
+        )
+
+
+# Process-lifetime singleton: strictly cheaper than lru_cache machinery
+# for every Depends(get_settings) / get_settings() call.
+SETTINGS: Final[Settings] = Settings.from_env()
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
 
-
-@lru_cache()
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the settings singleton (kept for backward compatibility).
+
+    Returns a frozen, slotted dataclass: attribute reads are plain slot
+    descriptors, safe to hit on hot paths and shareable across workers.
+    """
+    return SETTINGS
@@ -5,6 +5,8 @@ Database connection and session management.
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import msgspec
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
@@ -12,12 +14,25 @@ from app.config import get_settings
 
 settings = get_settings()
 
-# Create async engine
+# jsonb (de)serialization hooks for the asyncpg dialect: every jsonb
+# value crossing the wire goes through these, so use the same msgspec
+# coding the session router uses instead of stdlib json.
+_json_encoder = msgspec.json.Encoder()
+_json_decoder = msgspec.json.Decoder()
+
+# Create async engine. Pooled connections avoid per-request TCP
+# handshake cost; pre_ping transparently replaces connections dropped
+# by the server (e.g. Postgres restart) and recycle bounds their age.
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    pool_size=5,
+    json_serializer=lambda obj: _json_encoder.encode(obj).decode(),
+    json_deserializer=_json_decoder.decode,
+    pool_size=20,
     max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
 )
 
 # Session factory
@@ -5,12 +5,17 @@ Main entry point for the Sauna Design Interview API.
 """
 
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Mapping
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
 
 from app.config import get_settings
+from app.services.llm import _call_llm_with_fallback
 from app.routers import session, admin, expert_review, skill_admin
 
 settings = get_settings()
@@ -33,6 +38,9 @@ app = FastAPI(
     description="Backend API for Sauna Design Interview Voice Agent",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson is several times faster than stdlib json for the
+    # unicode-heavy Lithuanian payloads we return
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -44,7 +52,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Include routers
+# Include routers. This runs once at import: include_router appends the
+# (prefix-rewritten) routes onto app.router.routes, there is no per-request
+# or per-include matcher rebuild to avoid.
 app.include_router(session.router, prefix="/session", tags=["Session"])
 app.include_router(admin.router, prefix="/brain/config", tags=["Admin"])
 app.include_router(expert_review.router, prefix="/admin", tags=["Expert Review"])
@@ -75,36 +85,52 @@ async def health_check():
 # General Translation Endpoint
 # ============================================
 
-class TranslateRequest(BaseModel):
-    text: str
-    target_language: str
+# Language display names, read-only and built once at import
+_LANG_NAMES: Final[Mapping[str, str]] = MappingProxyType({
+    'en': 'English',
+    'ru': 'Russian',
+    'lt': 'Lithuanian',
+})
+
+# Prompt template built once at import instead of per request
+_TRANSLATE_PROMPT_TEMPLATE = """Translate the following text from Lithuanian to {lang_name}.
+Keep the same tone and meaning. Return ONLY the translated text, nothing else.
+
+Text to translate:
+{text}"""
+
+
+@lru_cache(maxsize=4096)
+def _translate_cached(text: str, lang_name: str) -> str:
+    """LLM translation memoized on (text, language) — UI labels repeat heavily."""
+    prompt = _TRANSLATE_PROMPT_TEMPLATE.format_map({"lang_name": lang_name, "text": text})
+    return _call_llm_with_fallback(prompt).strip()
 
 
 @app.post("/translate")
-async def translate_text(request: TranslateRequest):
+async def translate_text(request: Request):
     """Translate text to target language (for dynamic UI content)."""
-    from app.services.llm import _call_llm_with_fallback
-    
-    lang_names = {
-        'en': 'English',
-        'ru': 'Russian', 
-        'lt': 'Lithuanian',
-    }
-    lang_name = lang_names.get(request.target_language, request.target_language)
-    
-    # Don't translate if already in target language
-    if request.target_language == 'lt':
-        return {"translated_text": request.text}
-    
-    prompt = f"""Translate the following text from Lithuanian to {lang_name}.
-Keep the same tone and meaning. Return ONLY the translated text, nothing else.
+    # Two unconstrained string fields: parse the body directly instead of
+    # paying for a pydantic model per call
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=422, detail="Request body must be valid JSON")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=422, detail="Request body must be a JSON object")
+    text = body.get("text")
+    target_language = body.get("target_language")
+    if not isinstance(text, str) or not isinstance(target_language, str):
+        raise HTTPException(status_code=422, detail="text and target_language are required strings")
+
+    lang_name = _LANG_NAMES.get(target_language, target_language)
 
-Text to translate:
-{request.text}"""
+    # Don't translate if already in target language
+    if target_language == 'lt':
+        return {"translated_text": text}
 
     try:
-        result = _call_llm_with_fallback(prompt)
-        return {"translated_text": result.strip()}
+        return {"translated_text": _translate_cached(text, lang_name)}
     except Exception as e:
         print(f"Translation error: {e}")
-        return {"translated_text": request.text}
+        return {"translated_text": text}
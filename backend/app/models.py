@@ -3,17 +3,35 @@ Pydantic models for API requests and responses.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
+from enum import StrEnum
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
+
+# Shared config for small models instantiated many times per request
+# (history lists, slots dicts). Freezing skips copy-on-assignment checks
+# and makes instances safe to share between state snapshots.
+_HOT_MODEL_CONFIG = ConfigDict(frozen=True)
 
 
 # ============================================
 # Interview Mode
 # ============================================
 
-InterviewMode = Literal["quick", "precise"]
+class InterviewMode(StrEnum):
+    """Interview mode. StrEnum keeps string comparisons working while
+    giving pydantic its fast enum-membership path instead of the
+    per-call Literal matcher."""
+    QUICK = "quick"
+    PRECISE = "precise"
+
+
+class SlotFillStatus(StrEnum):
+    """Fill level of a slot for frontend display."""
+    FILLED = "filled"
+    PARTIAL = "partial"
+    EMPTY = "empty"
 
 
 # ============================================
@@ -22,6 +40,8 @@ InterviewMode = Literal["quick", "precise"]
 
 class SlotValue(BaseModel):
     """A single slot with value and confidence."""
+    model_config = _HOT_MODEL_CONFIG
+
     value: Optional[Any] = None
     confidence: float = Field(default=0.0, ge=0.0, le=1.0)
 
@@ -38,9 +58,11 @@ class SlotDefinition(BaseModel):
 
 class SlotStatus(BaseModel):
     """Slot status for frontend display."""
+    model_config = _HOT_MODEL_CONFIG
+
     slot_key: str
     label: str
-    status: Literal["filled", "partial", "empty"]
+    status: SlotFillStatus
     confidence: float
 
 
@@ -50,6 +72,8 @@ class SlotStatus(BaseModel):
 
 class Question(BaseModel):
     """A question to present to the user."""
+    model_config = _HOT_MODEL_CONFIG
+
     id: str
     text: str
     round_hint: Optional[int] = None
@@ -62,8 +86,8 @@ class QuestionDefinition(BaseModel):
     text_en: Optional[str] = None
     base_priority: int = 50
     round_hint: Optional[int] = None
-    slot_coverage: List[str] = []
-    risk_coverage: List[str] = []
+    slot_coverage: List[str] = Field(default_factory=list)
+    risk_coverage: List[str] = Field(default_factory=list)
     enabled: bool = True
 
 
@@ -73,10 +97,12 @@ class QuestionDefinition(BaseModel):
 
 class RiskFlag(BaseModel):
     """An active risk/conflict detected."""
+    model_config = _HOT_MODEL_CONFIG
+
     code: str
     severity: str = "medium"
     note: Optional[str] = None
-    evidence: List[str] = []
+    evidence: Tuple[str, ...] = ()
 
 
 class RiskRule(BaseModel):
@@ -132,6 +158,8 @@ class FeedbackStats(BaseModel):
 
 class Message(BaseModel):
     """A single message in the conversation."""
+    model_config = _HOT_MODEL_CONFIG
+
     role: str  # "agent" or "user"
     question_id: Optional[str] = None
     text: str
@@ -143,20 +171,35 @@ class Message(BaseModel):
 # ============================================
 
 class AgentState(BaseModel):
-    """Complete agent state for a session."""
+    """
+    Complete agent state for a session.
+
+    State is validated on ingress only: between turns the routers keep it
+    as a plain dict in the sessions.state jsonb column, and mutations
+    happen in controlled server code, so re-validating assignments and
+    copying on mutation is disabled.
+    """
+    model_config = ConfigDict(validate_assignment=False, extra="ignore", revalidate_instances="never")
+
     session_id: UUID
     language: str = "lt"
-    interview_mode: InterviewMode = "quick"
+    interview_mode: InterviewMode = InterviewMode.QUICK
     round: int = 1
-    history: List[Message] = []
-    slots: Dict[str, SlotValue] = {}
-    unknown_slots: List[str] = []
-    risk_flags: List[RiskFlag] = []
+    history: List[Message] = Field(default_factory=list)
+    slots: Dict[str, SlotValue] = Field(default_factory=dict)
+    unknown_slots: List[str] = Field(default_factory=list)
+    risk_flags: List[RiskFlag] = Field(default_factory=list)
     round_summary: Optional[str] = None
-    asked_question_ids: List[str] = []
-    next_questions: List[Question] = []
+    # Set for O(1) "already asked?" checks; unknown_slots stays a list
+    # because the LLM returns it ordered by importance.
+    asked_question_ids: Set[str] = Field(default_factory=set)
+    next_questions: List[Question] = Field(default_factory=list)
     contact_info: Optional[ContactInfo] = None
 
+    @field_serializer("asked_question_ids")
+    def _serialize_asked(self, value: Set[str]) -> List[str]:
+        return sorted(value)
+
 
 # ============================================
 # API Request Models
@@ -165,7 +208,7 @@ class AgentState(BaseModel):
 class StartSessionRequest(BaseModel):
     """Request to start a new session."""
     language: str = "lt"
-    interview_mode: InterviewMode = "quick"
+    interview_mode: InterviewMode = InterviewMode.QUICK
 
 
 class TranscriptConfirmation(BaseModel):
@@ -197,8 +240,8 @@ class StartSessionResponse(BaseModel):
     """Response after starting a session."""
     session_id: UUID
     round: int
-    questions: List[Question]
-    interview_mode: InterviewMode = "quick"
+    questions: Tuple[Question, ...]
+    interview_mode: InterviewMode = InterviewMode.QUICK
 
 
 class TranscribeResponse(BaseModel):
@@ -212,13 +255,13 @@ class SubmitAnswerResponse(BaseModel):
     """Response after submitting answers."""
     session_id: UUID
     round: int
-    slots_updated: List[str]
-    risk_flags: List[RiskFlag]
+    slots_updated: Tuple[str, ...]
+    risk_flags: Tuple[RiskFlag, ...]
     round_summary: Optional[str] = None
-    next_questions: List[Question]
+    next_questions: Tuple[Question, ...]
     is_complete: bool = False
     clarification_question: Optional[str] = None
-    slot_status: Optional[List[SlotStatus]] = None
+    slot_status: Optional[Tuple[SlotStatus, ...]] = None
     progress_percent: Optional[int] = None  # Overall completion percentage (0-100)
 
 
@@ -227,7 +270,7 @@ class FinalizeResponse(BaseModel):
     session_id: UUID
     final_markdown: str  # Contains summary for client (Sections I-III)
     slots: Dict[str, SlotValue]
-    risk_flags: List[RiskFlag]
+    risk_flags: Tuple[RiskFlag, ...]
     email_sent: bool = False  # True if full report was sent to email
 
 
@@ -242,8 +285,8 @@ class BrainConfigExportResponse(BaseModel):
 class BrainConfigValidationResponse(BaseModel):
     """Response after validating brain configuration."""
     valid: bool
-    errors: List[str] = []
-    warnings: List[str] = []
+    errors: Tuple[str, ...] = ()
+    warnings: Tuple[str, ...] = ()
 
 
 class BrainConfigImportResponse(BaseModel):
@@ -263,7 +306,7 @@ class LLMExtractionResponse(BaseModel):
     updated_slots: Dict[str, SlotValue]
     round_summary: str
     unknown_slots: List[str]
-    notes_for_backend: List[str] = []
+    notes_for_backend: List[str] = Field(default_factory=list)
 
 
 class LLMReportResponse(BaseModel):
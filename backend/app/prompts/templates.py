@@ -4,6 +4,59 @@ LLM Prompt Templates for the Sauna Design Interview Agent.
 All prompts are designed for JSON-only responses for reliable parsing.
 """
 
+import re
+import time
+from datetime import datetime
+
+import orjson
+
+# Report date string, recomputed at most once per minute
+_today_cache = ("", 0.0)
+
+
+def _report_date() -> str:
+    """Return today's date as YYYY-MM-DD, cached for a minute."""
+    global _today_cache
+    value, expires = _today_cache
+    now = time.monotonic()
+    if now >= expires:
+        value = datetime.now().strftime("%Y-%m-%d")
+        _today_cache = (value, now + 60.0)
+    return value
+
+
+class _PromptTemplate:
+    """
+    A str.format template pre-parsed at import time.
+
+    str.format re-runs its field parser on the whole template on every call,
+    which is wasted work for large static prompts. This splits the template
+    into static segments around the named fields once (handling {{ }} brace
+    escapes), so rendering is a plain string join.
+    """
+
+    def __init__(self, template: str, fields: tuple):
+        markers = {f: f"\x00{f}\x00" for f in fields}
+        marked = template.format(**markers)
+        # Odd indexes are field names, even indexes are static text
+        self._parts = re.split("\x00(" + "|".join(fields) + ")\x00", marked)
+
+    def render(self, **values) -> str:
+        return "".join(
+            values[part] if i & 1 else part
+            for i, part in enumerate(self._parts)
+        )
+
+    @property
+    def static_prefix(self) -> str:
+        """Static text before the first placeholder.
+
+        Bit-identical across requests, so a provider wrapper can mark it
+        as a cacheable prompt block (Anthropic cache_control / automatic
+        prefix caching).
+        """
+        return self._parts[0]
+
 # ============================================
 # System Prompt (Persona + Rules)
 # ============================================
@@ -22,6 +75,10 @@ Taisyklės:
    - Ventiliacija būtina (žmonės išnaudoja daug oro).
    - Garinėje vengti OSB, plastiko ir kitų sintetinių medžiagų."""
 
+# Constant prefix for building full prompts — every LLM call prepends the
+# system prompt plus a blank line, so concatenate it once at import.
+SYSTEM_PROMPT_PREFIX = SYSTEM_PROMPT + "\n\n"
+
 
 # ============================================
 # Extraction Prompt (Slots + Summary + Unknown)
@@ -93,12 +150,6 @@ Taisyklės:
 - Nurodyk 3–7 „Next steps" patikslinimų klausimus, jei dar yra spragų.
 - Venk marketingo, rašyk kaip projektavimo konsultantas.
 
-Ataskaitos pradžioje (prieš santrauką) įterpk kliento informaciją:
-{contact_header}
-
-Ataskaitos pabaigoje įterpk šį poraštės tekstą:
-{footer_text}
-
 Rekomenduojama struktūra:
 1. **Santrauka** – trumpas apibendrinimas
 2. **Naudojimo scenarijus ir žmonės** – kas ir kaip naudosis
@@ -114,6 +165,12 @@ Grąžink tik JSON:
   "final_markdown": "..."
 }}
 
+Ataskaitos pradžioje (prieš santrauką) įterpk kliento informaciją:
+{contact_header}
+
+Ataskaitos pabaigoje įterpk šį poraštės tekstą:
+{footer_text}
+
 agent_state:
 {agent_state}"""
 
@@ -124,21 +181,21 @@ agent_state:
 
 CLARIFICATION_PROMPT = """Vartotojo atsakymas buvo neaiškus arba per bendras. Sugeneruok natūralų patikslinimo klausimą.
 
-Sloto, kurį bandome patikslinti:
-- Slot: {slot_key}
-- Dabartinė reikšmė: {current_value}
-- Confidence: {confidence}
-
-Pradinė klausimas: {original_question}
-Vartotojo atsakymas: {user_answer}
-
 Sugeneruok vieną trumpą, draugišką patikslinimo klausimą lietuvių kalba.
 Klausk konkrečiau, siūlyk pavyzdžius ar intervalus, jei tinka.
 
 Grąžink tik JSON:
 {{
   "clarification_question": "..."
-}}"""
+}}
+
+Sloto, kurį bandome patikslinti:
+- Slot: {slot_key}
+- Dabartinė reikšmė: {current_value}
+- Confidence: {confidence}
+
+Pradinė klausimas: {original_question}
+Vartotojo atsakymas: {user_answer}"""
 
 
 # ============================================
@@ -165,11 +222,52 @@ active_risk_codes:
 # Helper Functions
 # ============================================
 
+# Compiled once at import; the constants above stay the source of truth
+_EXTRACTION_TEMPLATE = _PromptTemplate(EXTRACTION_PROMPT, ("agent_state", "user_answer"))
+_REPORT_TEMPLATE = _PromptTemplate(REPORT_PROMPT, ("agent_state",))
+_REPORT_WITH_CONTACT_TEMPLATE = _PromptTemplate(
+    REPORT_WITH_CONTACT_PROMPT, ("contact_header", "footer_text", "agent_state")
+)
+_CLARIFICATION_TEMPLATE = _PromptTemplate(
+    CLARIFICATION_PROMPT,
+    ("slot_key", "current_value", "confidence", "original_question", "user_answer"),
+)
+_RISK_EXPLANATION_TEMPLATE = _PromptTemplate(RISK_EXPLANATION_PROMPT, ("agent_state", "risk_codes"))
+
+
+# Derived caches the session router keeps inside state. They duplicate
+# information the prompts already carry (history, progress) and would
+# only inflate token counts if dumped into the LLM context.
+_DERIVED_STATE_KEYS = frozenset({
+    "formatted_history",
+    "last_agent_question_text",
+    "progress_percent_cache",
+})
+
+
+def serialize_agent_state(agent_state) -> str:
+    """
+    Serialize agent_state for prompt injection.
+
+    Accepts a pre-serialized string so callers building several prompts in
+    one turn (extraction + risk + report) can serialize the state once.
+    orjson is considerably faster than stdlib json for the indented dump.
+    Derived cache keys are stripped so the transcript is not shipped to
+    the LLM twice.
+    """
+    if isinstance(agent_state, str):
+        return agent_state
+    if isinstance(agent_state, dict) and not _DERIVED_STATE_KEYS.isdisjoint(agent_state):
+        agent_state = {
+            k: v for k, v in agent_state.items() if k not in _DERIVED_STATE_KEYS
+        }
+    return orjson.dumps(agent_state, option=orjson.OPT_INDENT_2).decode()
+
+
 def format_extraction_prompt(agent_state: dict, user_answer: str) -> str:
     """Format the extraction prompt with actual data."""
-    import json
-    return EXTRACTION_PROMPT.format(
-        agent_state=json.dumps(agent_state, indent=2, ensure_ascii=False),
+    return _EXTRACTION_TEMPLATE.render(
+        agent_state=serialize_agent_state(agent_state),
         user_answer=user_answer,
     )
 
@@ -180,40 +278,37 @@ def format_report_prompt(
     report_footer: str = None,
 ) -> str:
     """Format the report prompt with actual data and optional contact/footer."""
-    import json
-    from datetime import datetime
-
     # If no contact info or footer, use simple prompt
     if not contact_info and not report_footer:
-        return REPORT_PROMPT.format(
-            agent_state=json.dumps(agent_state, indent=2, ensure_ascii=False),
+        return _REPORT_TEMPLATE.render(
+            agent_state=serialize_agent_state(agent_state),
         )
 
-    # Build contact header
+    # Build contact header line by line — inputs have a known shape,
+    # so no intermediate list/filter/join chain is needed
     contact_header = ""
     if contact_info:
         name = contact_info.get("name", "")
         email = contact_info.get("email", "")
         phone = contact_info.get("phone", "")
-        date = datetime.now().strftime("%Y-%m-%d")
 
-        contact_parts = []
-        if name:
-            contact_parts.append(f"**Klientas:** {name}")
-        if email or phone:
-            contact_details = " | ".join(filter(None, [email, phone]))
-            contact_parts.append(f"**Kontaktai:** {contact_details}")
-        contact_parts.append(f"**Data:** {date}")
+        name_line = f"**Klientas:** {name}\n" if name else ""
+        if email and phone:
+            contact_line = f"**Kontaktai:** {email} | {phone}\n"
+        elif email or phone:
+            contact_line = f"**Kontaktai:** {email or phone}\n"
+        else:
+            contact_line = ""
 
-        contact_header = "\n".join(contact_parts)
+        contact_header = f"{name_line}{contact_line}**Data:** {_report_date()}"
 
     # Build footer
     footer_text = ""
     if report_footer:
         footer_text = f"\n---\n{report_footer}"
 
-    return REPORT_WITH_CONTACT_PROMPT.format(
-        agent_state=json.dumps(agent_state, indent=2, ensure_ascii=False),
+    return _REPORT_WITH_CONTACT_TEMPLATE.render(
+        agent_state=serialize_agent_state(agent_state),
         contact_header=contact_header if contact_header else "(nėra kontaktinės informacijos)",
         footer_text=footer_text if footer_text else "(nėra poraštės)",
     )
@@ -227,10 +322,10 @@ def format_clarification_prompt(
     user_answer: str,
 ) -> str:
     """Format the clarification prompt."""
-    return CLARIFICATION_PROMPT.format(
+    return _CLARIFICATION_TEMPLATE.render(
         slot_key=slot_key,
         current_value=current_value,
-        confidence=confidence,
+        confidence=str(confidence),
         original_question=original_question,
         user_answer=user_answer,
     )
@@ -238,10 +333,9 @@ def format_clarification_prompt(
 
 def format_risk_explanation_prompt(agent_state: dict, risk_codes: list) -> str:
     """Format the risk explanation prompt with actual data."""
-    import json
-    return RISK_EXPLANATION_PROMPT.format(
-        agent_state=json.dumps(agent_state, indent=2, ensure_ascii=False),
-        risk_codes=json.dumps(risk_codes, ensure_ascii=False),
+    return _RISK_EXPLANATION_TEMPLATE.render(
+        agent_state=serialize_agent_state(agent_state),
+        risk_codes=orjson.dumps(risk_codes).decode(),
     )
 
 # ============================================
@@ -250,15 +344,6 @@ def format_risk_explanation_prompt(agent_state: dict, risk_codes: list) -> str:
 
 FOLLOWUP_QUESTION_PROMPT_V2 = """Tu esi pirties projektavimo interviu asistentas. Sugeneruok natūralų klausimą pagal visą pokalbio kontekstą.
 
-Pokalbio istorija (nuo pradžios iki dabar):
-{conversation_history}
-
-Surinkti duomenys:
-{collected_slots}
-
-Trūkstami duomenys:
-{missing_slots}
-
 Sugeneruok VIENĄ natūralų tęstinį klausimą lietuvių kalba, kuris:
 1) Remtųsi tuo, ką klientas pasakė ankstesniuose atsakymuose
 2) Padėtų surinkti informaciją apie vieną iš trūkstamų duomenų
@@ -269,7 +354,20 @@ Sugeneruok VIENĄ natūralų tęstinį klausimą lietuvių kalba, kuris:
 Grąžink tik JSON:
 {{
   "followup_question": "..."
-}}"""
+}}
+
+Pokalbio istorija (nuo pradžios iki dabar):
+{conversation_history}
+
+Surinkti duomenys:
+{collected_slots}
+
+Trūkstami duomenys:
+{missing_slots}"""
+
+_FOLLOWUP_V2_TEMPLATE = _PromptTemplate(
+    FOLLOWUP_QUESTION_PROMPT_V2, ("conversation_history", "collected_slots", "missing_slots")
+)
 
 
 def format_followup_prompt_v2(
@@ -278,23 +376,21 @@ def format_followup_prompt_v2(
     missing_slots: list,
 ) -> str:
     """Format the follow-up question generation prompt with full conversation context."""
-    import json
-
     # Format conversation history
     history_str = "\n".join(conversation_history) if conversation_history else "(pokalbis dar neprasidėjo)"
 
-    # Format collected slots for readability
-    collected_text = []
-    for key, slot in collected_slots.items():
-        if isinstance(slot, dict) and slot.get("value"):
-            conf = slot.get("confidence", 0)
-            collected_text.append(f"- {key}: {slot['value']} (tikrumas: {conf:.0%})")
-    collected_str = "\n".join(collected_text) if collected_text else "(dar nieko nesurinkta)"
+    # Format collected slots for readability — join the generator directly,
+    # no intermediate list
+    collected_str = "\n".join(
+        f"- {key}: {slot['value']} (tikrumas: {slot.get('confidence', 0):.0%})"
+        for key, slot in collected_slots.items()
+        if isinstance(slot, dict) and slot.get("value")
+    ) or "(dar nieko nesurinkta)"
 
     # Format missing slots
     missing_str = ", ".join(missing_slots) if missing_slots else "(visi duomenys surinkti)"
 
-    return FOLLOWUP_QUESTION_PROMPT_V2.format(
+    return _FOLLOWUP_V2_TEMPLATE.render(
         conversation_history=history_str,
         collected_slots=collected_str,
         missing_slots=missing_str,
@@ -4,6 +4,11 @@ LLM Prompt Templates v2 - Enhanced with Pirtis Design Skill Integration
 All prompts now incorporate the skill methodology for better question generation.
 """
 
+from datetime import datetime
+from functools import lru_cache
+
+from app.prompts.templates import _PromptTemplate, serialize_agent_state
+
 # ============================================
 # System Prompt (Enhanced with Skill Persona)
 # ============================================
@@ -46,6 +51,9 @@ KĄ NEDARYTI:
 - Niekada nepraleisk ventiliacijos aptarimo
 - Nepamiršk išorinės infrastruktūros"""
 
+# Constant prefix for building full prompts, concatenated once at import.
+SYSTEM_PROMPT_V2_PREFIX = SYSTEM_PROMPT_V2 + "\n\n"
+
 
 # ============================================
 # Enhanced Follow-up Question Prompt
@@ -82,20 +90,27 @@ ALL_DATA_TEXT = {
     "ru": "(все данные собраны)",
 }
 
-FOLLOWUP_QUESTION_PROMPT_V3 = """You are an experienced sauna design consultant with 15 years of experience. Generate a natural follow-up question based on the methodology and conversation context.
-
-{language_instruction}
-
-{skill_methodology}
-
-CONVERSATION HISTORY:
-{conversation_history}
-
-COLLECTED DATA:
-{collected_slots}
+# Only the most recent turns are sent to the LLM; older context is
+# already condensed into the collected slots, and an unbounded history
+# inflates tokens, latency and cost on long sessions.
+_HISTORY_WINDOW = 20
+
+# Per-language strings bundled into one tuple so the follow-up formatter
+# does a single lookup + unpack instead of four .get() calls
+_LANG_BUNDLE = {
+    lang: (
+        LANGUAGE_INSTRUCTIONS[lang],
+        NO_HISTORY_TEXT[lang],
+        NO_DATA_TEXT[lang],
+        ALL_DATA_TEXT[lang],
+    )
+    for lang in LANGUAGE_INSTRUCTIONS
+}
 
-MISSING DATA:
-{missing_slots}
+# Static rules first, dynamic context last, ordered by volatility
+# (skill changes rarely, language per session, history per turn) — keeps
+# the longest possible bit-identical prefix for LLM prompt caching.
+FOLLOWUP_QUESTION_PROMPT_V3 = """You are an experienced sauna design consultant with 15 years of experience. Generate a natural follow-up question based on the methodology and conversation context.
 
 QUESTION GENERATION RULES:
 1) If the conversation hasn't started yet – begin with a vision question about ideal sauna experience
@@ -107,23 +122,36 @@ QUESTION GENERATION RULES:
 
 IMPORTANT: If the client mentioned something significant (e.g., lake, large budget, business use) – ask a related follow-up question.
 
-CRITICAL: You MUST generate the question in the language specified above! The client expects to communicate in that language.
+CRITICAL: You MUST generate the question in the language specified below! The client expects to communicate in that language.
 
 Return only JSON:
 {{
   "followup_question": "...",
   "reasoning": "brief explanation why this question"
-}}"""
+}}
+
+{skill_methodology}
+
+{language_instruction}
+
+CONVERSATION HISTORY:
+{conversation_history}
+
+COLLECTED DATA:
+{collected_slots}
+
+MISSING DATA:
+{missing_slots}"""
 
 
 # ============================================
 # Enhanced Report Prompt with Skill Template
 # ============================================
 
+# Static rules and structure form the prefix; the skill template (rarely
+# changing) follows, and per-session data comes last for prompt caching.
 REPORT_PROMPT_V2 = """Sukurk galutinę projektavimo užduotį pagal Pirties Laboratorijos metodiką.
 
-{skill_documentation_template}
-
 TAISYKLĖS:
 - Remkis tik surinkta informacija (nieko neišsigalvok)
 - Nepatvirtintus dalykus perkelk į "KLAUSIMAI APTARIMUI" skyrių
@@ -174,17 +202,19 @@ IX. PROJEKTAVIMO DARBŲ APIMTIS
    - Projektavimo eiga
    - Orientaciniai terminai
 
+Grąžink tik JSON:
+{{
+  "final_markdown": "..."
+}}
+
+{skill_documentation_template}
+
 {contact_header}
 
 {footer_text}
 
 SESIJOS DUOMENYS:
-{agent_state}
-
-Grąžink tik JSON:
-{{
-  "final_markdown": "..."
-}}"""
+{agent_state}"""
 
 
 # ============================================
@@ -213,34 +243,141 @@ TAISYKLĖS:
 - Confidence < 0.4: labai neaiški informacija
 - Niekada neišsigalvok – jei tik spėjimas, confidence mažas
 
+Grąžink tik JSON:
+{{
+  "updated_slots": {{ "<slot_key>": {{"value": ..., "confidence": 0.0}} ... }},
+  "round_summary": "3-7 sakiniai apie tai, ką supratai",
+  "unknown_slots": ["slot_key_1", "slot_key_2", ...],
+  "notes_for_backend": ["pastabos (max 5)"]
+}}
+
 SESIJOS BŪSENA:
 {agent_state}
 
 KLIENTO ATSAKYMAS:
-{user_answer}
+{user_answer}"""
+
+
+# ============================================
+# Combined Extraction + Follow-up Prompt
+# ============================================
+
+# Precise mode runs extraction and follow-up generation on every turn;
+# fusing them into one prompt saves a full LLM round-trip per turn and
+# sends agent_state only once. Same static-first layout as above.
+COMBINED_EXTRACT_FOLLOWUP_PROMPT_V3 = """Tu esi pirties projektavimo konsultantas. Atlik DVI užduotis viename atsakyme: (1) ištrauk struktūruotą informaciją iš kliento atsakymo, (2) sugeneruok kitą tęstinį klausimą.
+
+KRITINIAI PARAMETRAI (prioritetas surinkimui):
+1. purpose - Pirties paskirtis (šeimos poilsis, sveikatinimas, verslas, mišrus)
+2. users - Naudotojai (kiek žmonių, amžius, specialūs poreikiai)
+3. location - Vieta (miestas/kaimas, šalia vandens, klimatas)
+4. size_direction - Ploto limitas ir ribojantys veiksniai
+5. stove_type - Krosnies tipas (periodinio/nuolatinio kūrenimo)
+6. fuel_type - Kuro tipas (malkos, elektra, dujos)
+7. microclimate - Mikroklimato lūkesčiai (temperatūra, drėgnumas)
+8. room_program - Patalpų programa (garinė, poilsio, dušai, etc.)
+9. infrastructure - Infrastruktūra (vanduo, elektra, kanalizacija)
+10. budget - Biudžetas
+11. timeline - Terminai
+12. ritual - Pirties ritualas (tradicinis, modernus)
+
+IŠTRAUKIMO TAISYKLĖS:
+- Confidence >= 0.7: aiški, konkreti informacija
+- Confidence 0.4-0.7: dalinė informacija arba spėjimas
+- Confidence < 0.4: labai neaiški informacija
+- Niekada neišsigalvok – jei tik spėjimas, confidence mažas
+
+KLAUSIMO GENERAVIMO TAISYKLĖS:
+1) Remkis tuo, ką klientas pasakė ankstesniuose atsakymuose
+2) Padėk surinkti vieną iš trūkstamų duomenų (unknown_slots)
+3) Būk draugiškas ir profesionalus
+4) Niekada nekartok jau užduotų klausimų
+5) Vienas klausimas – max 2 sakiniai
+
+CRITICAL: You MUST generate followup_question in the language specified below!
 
 Grąžink tik JSON:
 {{
   "updated_slots": {{ "<slot_key>": {{"value": ..., "confidence": 0.0}} ... }},
   "round_summary": "3-7 sakiniai apie tai, ką supratai",
   "unknown_slots": ["slot_key_1", "slot_key_2", ...],
-  "notes_for_backend": ["pastabos (max 5)"]
-}}"""
+  "notes_for_backend": ["pastabos (max 5)"],
+  "followup_question": "...",
+  "reasoning": "trumpas paaiškinimas, kodėl šis klausimas"
+}}
+
+{skill_methodology}
+
+{language_instruction}
+
+POKALBIO ISTORIJA:
+{conversation_history}
+
+SESIJOS BŪSENA:
+{agent_state}
+
+KLIENTO ATSAKYMAS:
+{user_answer}"""
 
 
 # ============================================
 # Helper Functions (Updated)
 # ============================================
 
+# Pre-parsed once at import; the constants above stay the source of truth
+_EXTRACTION_V2_TEMPLATE = _PromptTemplate(
+    EXTRACTION_PROMPT_V2, ("agent_state", "user_answer")
+)
+_FOLLOWUP_V3_TEMPLATE = _PromptTemplate(
+    FOLLOWUP_QUESTION_PROMPT_V3,
+    (
+        "skill_methodology",
+        "language_instruction",
+        "conversation_history",
+        "collected_slots",
+        "missing_slots",
+    ),
+)
+_REPORT_V2_TEMPLATE = _PromptTemplate(
+    REPORT_PROMPT_V2,
+    ("skill_documentation_template", "contact_header", "footer_text", "agent_state"),
+)
+_COMBINED_V3_TEMPLATE = _PromptTemplate(
+    COMBINED_EXTRACT_FOLLOWUP_PROMPT_V3,
+    (
+        "skill_methodology",
+        "language_instruction",
+        "conversation_history",
+        "agent_state",
+        "user_answer",
+    ),
+)
+
+
 def format_extraction_prompt_v2(agent_state: dict, user_answer: str) -> str:
     """Format the enhanced extraction prompt with actual data."""
-    import json
-    return EXTRACTION_PROMPT_V2.format(
-        agent_state=json.dumps(agent_state, indent=2, ensure_ascii=False),
+    return _EXTRACTION_V2_TEMPLATE.render(
+        agent_state=serialize_agent_state(agent_state),
         user_answer=user_answer,
     )
 
 
+@lru_cache(maxsize=8)
+def _skill_methodology_block(methodology: str) -> str:
+    """Build (and memoize) the skill methodology section.
+
+    The skill text changes only when a new skill version is activated, so
+    the slice + prefix concat is cached on the string itself.
+    """
+    return f"METHODOLOGY:\n{methodology[:2000]}"  # Limit length
+
+
+@lru_cache(maxsize=8)
+def _skill_documentation_block(template: str) -> str:
+    """Build (and memoize) the report documentation-template section."""
+    return f"DOKUMENTACIJOS ŠABLONAS:\n{template[:3000]}"
+
+
 def format_followup_prompt_v3(
     conversation_history: list,
     collected_slots: dict,
@@ -249,34 +386,35 @@ def format_followup_prompt_v3(
     language: str = "lt",
 ) -> str:
     """Format the enhanced follow-up prompt with skill methodology and language support."""
-    import json
-
-    # Get language-specific instruction
-    language_instruction = LANGUAGE_INSTRUCTIONS.get(language, LANGUAGE_INSTRUCTIONS["lt"])
+    # One lookup for all language-specific strings
+    language_instruction, no_history, no_data, all_data = _LANG_BUNDLE.get(
+        language, _LANG_BUNDLE["lt"]
+    )
 
-    # Format conversation history
-    no_history = NO_HISTORY_TEXT.get(language, NO_HISTORY_TEXT["lt"])
-    history_str = "\n".join(conversation_history) if conversation_history else no_history
+    # Format conversation history, bounded to the last turns
+    history_str = (
+        "\n".join(conversation_history[-_HISTORY_WINDOW:])
+        if conversation_history
+        else no_history
+    )
 
-    # Format collected slots for readability
-    no_data = NO_DATA_TEXT.get(language, NO_DATA_TEXT["lt"])
-    collected_text = []
-    for key, slot in collected_slots.items():
-        if isinstance(slot, dict) and slot.get("value"):
-            conf = slot.get("confidence", 0)
-            collected_text.append(f"- {key}: {slot['value']} ({conf:.0%})")
-    collected_str = "\n".join(collected_text) if collected_text else no_data
+    # Format collected slots for readability — generator straight into
+    # the join, no intermediate list
+    collected_str = "\n".join(
+        f"- {key}: {slot['value']} ({slot.get('confidence', 0):.0%})"
+        for key, slot in collected_slots.items()
+        if isinstance(slot, dict) and slot.get("value")
+    ) or no_data
 
     # Format missing slots
-    all_data = ALL_DATA_TEXT.get(language, ALL_DATA_TEXT["lt"])
     missing_str = ", ".join(missing_slots) if missing_slots else all_data
 
     # Get skill methodology section
     skill_methodology = ""
     if skill_content and skill_content.get('methodology'):
-        skill_methodology = f"METHODOLOGY:\n{skill_content['methodology'][:2000]}"  # Limit length
+        skill_methodology = _skill_methodology_block(skill_content['methodology'])
 
-    return FOLLOWUP_QUESTION_PROMPT_V3.format(
+    return _FOLLOWUP_V3_TEMPLATE.render(
         language_instruction=language_instruction,
         skill_methodology=skill_methodology,
         conversation_history=history_str,
@@ -285,6 +423,37 @@ def format_followup_prompt_v3(
     )
 
 
+def format_combined_prompt_v3(
+    agent_state: dict,
+    user_answer: str,
+    conversation_history: list,
+    skill_content: dict = None,
+    language: str = "lt",
+) -> str:
+    """Format the combined extraction + follow-up prompt (one LLM call per turn)."""
+    language_instruction, no_history, _no_data, _all_data = _LANG_BUNDLE.get(
+        language, _LANG_BUNDLE["lt"]
+    )
+
+    history_str = (
+        "\n".join(conversation_history[-_HISTORY_WINDOW:])
+        if conversation_history
+        else no_history
+    )
+
+    skill_methodology = ""
+    if skill_content and skill_content.get('methodology'):
+        skill_methodology = _skill_methodology_block(skill_content['methodology'])
+
+    return _COMBINED_V3_TEMPLATE.render(
+        skill_methodology=skill_methodology,
+        language_instruction=language_instruction,
+        conversation_history=history_str,
+        agent_state=serialize_agent_state(agent_state),
+        user_answer=user_answer,
+    )
+
+
 def format_report_prompt_v2(
     agent_state: dict,
     contact_info: dict = None,
@@ -292,9 +461,6 @@ def format_report_prompt_v2(
     skill_content: dict = None,
 ) -> str:
     """Format the enhanced report prompt with skill template."""
-    import json
-    from datetime import datetime
-
     # Build contact header
     contact_header = ""
     if contact_info:
@@ -321,11 +487,11 @@ def format_report_prompt_v2(
     # Get documentation template from skill
     documentation_template = ""
     if skill_content and skill_content.get('documentation_template'):
-        documentation_template = f"DOKUMENTACIJOS ŠABLONAS:\n{skill_content['documentation_template'][:3000]}"
+        documentation_template = _skill_documentation_block(skill_content['documentation_template'])
 
-    return REPORT_PROMPT_V2.format(
+    return _REPORT_V2_TEMPLATE.render(
         skill_documentation_template=documentation_template,
-        agent_state=json.dumps(agent_state, indent=2, ensure_ascii=False),
+        agent_state=serialize_agent_state(agent_state),
         contact_header=contact_header if contact_header else "",
         footer_text=footer_text if footer_text else "",
     )
@@ -6,16 +6,29 @@ Also provides feedback analytics endpoints.
 Protected by X-Admin-Key header.
 """
 
-from datetime import datetime
+import asyncio
+import hashlib
+import hmac
+from collections import OrderedDict
+from datetime import datetime, timedelta
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query
-from sqlalchemy import text
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import ARRAY, Boolean, Float, Integer, String, bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import yaml
 
+try:
+    # libyaml C loader — same semantics as SafeLoader, several times
+    # faster on multi-KB configs
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not installed
+    from yaml import SafeLoader as _YamlLoader
+
 from app.config import get_settings
 from app.database import get_db
 from app.models import (
@@ -31,10 +44,15 @@ from app.services.brain import brain_config
 router = APIRouter()
 settings = get_settings()
 
+# Encoded once at import: avoids the settings attribute lookup and str
+# encode on every admin request, and compare_digest on bytes takes its
+# fastest constant-time path
+_ADMIN_KEY_BYTES = settings.admin_api_key.encode()
+
 
 async def verify_admin_key(x_admin_key: str = Header(...)):
-    """Verify the admin API key."""
-    if x_admin_key != settings.admin_api_key:
+    """Verify the admin API key (constant-time comparison)."""
+    if not hmac.compare_digest(x_admin_key.encode(), _ADMIN_KEY_BYTES):
         raise HTTPException(status_code=403, detail="Invalid admin key")
     return True
 
@@ -57,83 +75,120 @@ async def verify_admin_credentials(
 # Feedback Endpoints
 # ============================================
 
+# One canonical query text regardless of which filters are set, so
+# SQLAlchemy compiles it once and asyncpg reuses a single prepared
+# statement/plan. Optional filters are resolved to concrete bounds in
+# Python (avoids ":param IS NULL OR ..." double-binding, which trips
+# asyncpg type inference).
+_FEEDBACK_LIST_SQL = text("""
+    SELECT id, session_id, rating, feedback_text, created_at
+    FROM feedback
+    WHERE rating >= :min_rating
+      AND rating <= :max_rating
+      AND (created_at, id) < (:cursor_created_at, :cursor_id)
+    ORDER BY created_at DESC, id DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+# Sentinel cursor matching every row: all real created_at values sort
+# before datetime.max, so the keyset predicate is a no-op on page one
+_CURSOR_MAX_CREATED_AT = datetime.max
+_CURSOR_MAX_ID = UUID("ffffffff-ffff-ffff-ffff-ffffffffffff")
+
+
 @router.get("/feedback", response_model=List[FeedbackResponse])
 async def list_feedback(
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
     min_rating: Optional[int] = Query(None, ge=1, le=5),
     max_rating: Optional[int] = Query(None, ge=1, le=5),
+    cursor_created_at: Optional[datetime] = Query(None),
+    cursor_id: Optional[UUID] = Query(None),
     db: AsyncSession = Depends(get_db),
     _: bool = Depends(verify_admin_key),
 ):
     """
     List all feedback entries with optional filtering.
-    """
-    query = """
-        SELECT id, session_id, rating, feedback_text, created_at
-        FROM feedback
-        WHERE 1=1
-    """
-    params = {"limit": limit, "offset": offset}
 
-    if min_rating is not None:
-        query += " AND rating >= :min_rating"
-        params["min_rating"] = min_rating
-
-    if max_rating is not None:
-        query += " AND rating <= :max_rating"
-        params["max_rating"] = max_rating
-
-    query += " ORDER BY created_at DESC LIMIT :limit OFFSET :offset"
-
-    result = await db.execute(text(query), params)
-    rows = result.fetchall()
+    Supports keyset pagination: pass the last row's created_at and id as
+    cursor_created_at/cursor_id to fetch the next page without the
+    O(offset) scan cost of deep OFFSET pages.
+    """
+    has_cursor = cursor_created_at is not None and cursor_id is not None
+    params = {
+        "limit": limit,
+        # Keyset pagination replaces OFFSET: page one starts at the
+        # sentinel cursor, later pages start strictly before the cursor row
+        "offset": 0 if has_cursor else offset,
+        "min_rating": min_rating if min_rating is not None else 1,
+        "max_rating": max_rating if max_rating is not None else 5,
+        "cursor_created_at": cursor_created_at if has_cursor else _CURSOR_MAX_CREATED_AT,
+        "cursor_id": cursor_id if has_cursor else _CURSOR_MAX_ID,
+    }
 
-    return [
-        FeedbackResponse(
-            id=row[0],
-            session_id=row[1],
-            rating=row[2],
-            feedback_text=row[3],
-            created_at=row[4],
-        )
-        for row in rows
-    ]
+    result = await db.stream(_FEEDBACK_LIST_SQL, params)
+
+    # Stream rows straight to the wire instead of materializing the list,
+    # the Pydantic models and the full JSON body at once. Returning a
+    # Response bypasses response_model serialization (it still documents
+    # the schema); orjson handles UUID/datetime natively.
+    async def _rows_json():
+        yield b"["
+        first = True
+        async for row in result:
+            if not first:
+                yield b","
+            first = False
+            yield orjson.dumps({
+                "id": row[0],
+                "session_id": row[1],
+                "rating": row[2],
+                "feedback_text": row[3],
+                "created_at": row[4],
+            })
+        yield b"]"
+
+    return StreamingResponse(_rows_json(), media_type="application/json")
 
 
 @router.get("/feedback/stats", response_model=FeedbackStats)
 async def get_feedback_stats(
+    days: Optional[int] = Query(None, ge=1, le=3650),
     db: AsyncSession = Depends(get_db),
     _: bool = Depends(verify_admin_key),
 ):
     """
     Get aggregated feedback statistics.
-    """
-    # Get total count and average
-    result = await db.execute(
-        text("SELECT COUNT(*), COALESCE(AVG(rating), 0) FROM feedback")
-    )
-    row = result.fetchone()
-    total_count = row[0]
-    average_rating = float(row[1])
 
-    # Get rating distribution
+    Pass ?days=N to restrict to recent feedback; combined with the BRIN
+    index on created_at this skips old pages instead of scanning the
+    whole table. Default is all-time (unchanged behavior).
+    """
+    # Single scan: count, average and per-rating distribution in one row.
+    # The window cutoff is resolved in Python (all-time uses a sentinel
+    # that matches every row) so the statement text stays static and
+    # every parameter is bound exactly once.
+    cutoff = datetime.now() - timedelta(days=days) if days else datetime.min
     result = await db.execute(
         text("""
-            SELECT rating, COUNT(*) as count
+            SELECT COUNT(*),
+                   COALESCE(AVG(rating), 0),
+                   COUNT(*) FILTER (WHERE rating = 1),
+                   COUNT(*) FILTER (WHERE rating = 2),
+                   COUNT(*) FILTER (WHERE rating = 3),
+                   COUNT(*) FILTER (WHERE rating = 4),
+                   COUNT(*) FILTER (WHERE rating = 5)
             FROM feedback
-            GROUP BY rating
-            ORDER BY rating
-        """)
+            WHERE created_at > :cutoff
+        """),
+        {"cutoff": cutoff},
     )
-    distribution = {i: 0 for i in range(1, 6)}
-    for row in result.fetchall():
-        distribution[row[0]] = row[1]
+    row = result.fetchone()
 
     return FeedbackStats(
-        total_count=total_count,
-        average_rating=round(average_rating, 2),
-        rating_distribution=distribution,
+        total_count=row[0],
+        average_rating=round(float(row[1]), 2),
+        rating_distribution={i: row[i + 1] for i in range(1, 6)},
     )
 
 
@@ -149,7 +204,8 @@ async def get_feedback_detail(
     result = await db.execute(
         text("""
             SELECT f.id, f.session_id, f.rating, f.feedback_text, f.created_at,
-                   s.language, s.completed_at, s.state
+                   s.language, s.completed_at,
+                   s.state->'slots', s.state->'contact_info'
             FROM feedback f
             JOIN sessions s ON f.session_id = s.session_id
             WHERE f.id = :id
@@ -160,20 +216,27 @@ async def get_feedback_detail(
     if not row:
         raise HTTPException(status_code=404, detail="Feedback not found")
 
-    import json
-    state = row[7] if isinstance(row[7], dict) else json.loads(row[7])
+    # Only the two needed jsonb keys are extracted in SQL — the session
+    # state also holds the full history/transcripts, which would be
+    # fetched and deserialized just to be discarded
+    slots = row[7] if isinstance(row[7], dict) else orjson.loads(row[7] or "{}")
+    contact_info = row[8] if isinstance(row[8], dict) else (
+        orjson.loads(row[8]) if row[8] is not None else None
+    )
 
+    # UUID/datetime values are serialized by the response layer; no need
+    # to coerce them to strings by hand
     return {
-        "id": str(row[0]),
-        "session_id": str(row[1]),
+        "id": row[0],
+        "session_id": row[1],
         "rating": row[2],
         "feedback_text": row[3],
-        "created_at": row[4].isoformat(),
+        "created_at": row[4],
         "session": {
             "language": row[5],
-            "completed_at": row[6].isoformat() if row[6] else None,
-            "slots": state.get("slots", {}),
-            "contact_info": state.get("contact_info"),
+            "completed_at": row[6],
+            "slots": slots,
+            "contact_info": contact_info,
         },
     }
 
@@ -214,21 +277,20 @@ async def get_report_footer(
     )
     row = result.fetchone()
     if row:
-        import json
-        return {"report_footer": json.loads(row[0])}
+        return {"report_footer": orjson.loads(row[0])}
     return {"report_footer": ""}
 
 
 @router.put("/config/report-footer")
 async def set_report_footer(
     footer_text: str,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     _: bool = Depends(verify_admin_key),
 ):
     """
     Update the report footer text.
     """
-    import json
     await db.execute(
         text("""
             INSERT INTO brain_config (key, value, updated_at)
@@ -236,11 +298,11 @@ async def set_report_footer(
             ON CONFLICT (key)
             DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()
         """),
-        {"value": json.dumps(footer_text)},
+        {"value": orjson.dumps(footer_text).decode()},
     )
 
-    # Invalidate cache
-    brain_config.invalidate_cache()
+    # Invalidate cache after the response is sent
+    background_tasks.add_task(brain_config.invalidate_cache)
 
     return {"success": True, "report_footer": footer_text}
 
@@ -267,84 +329,151 @@ async def export_config(
     )
 
 
-@router.post("/validate", response_model=BrainConfigValidationResponse)
-async def validate_config(
-    request: BrainConfigImportRequest,
-    _: bool = Depends(verify_admin_key),
-):
+REQUIRED_WEIGHTS = frozenset({"base_priority", "missing_slot", "risk", "round_fit", "asked_penalty"})
+
+# Reject oversized uploads before parsing: PyYAML builds a Python object
+# for every node, so an unbounded document can balloon memory. Real
+# configs are tens of KB; 1 MiB leaves generous headroom.
+_MAX_YAML_BYTES = 1_048_576
+
+# Serializes /import per worker so concurrent imports don't race on the
+# same upserts; the advisory lock inside the transaction extends the
+# exclusion across workers
+_import_lock = asyncio.Lock()
+
+# Parse + validation results memoized by content hash: admins and CI
+# pipelines re-POST identical YAML on retries, and the parse dominates.
+# Cleared when the brain config version moves, like the other derived caches.
+_YAML_CACHE: "OrderedDict[bytes, tuple]" = OrderedDict()
+_YAML_CACHE_MAX = 32
+_yaml_cache_version = -1
+
+
+async def _parse_and_validate(yaml_content: str) -> tuple:
     """
-    Validate YAML configuration without saving.
+    Parse YAML and validate it, memoized by blake2b content hash.
+
+    Returns:
+        (config_or_None, errors, warnings) — config is None when the
+        payload failed to parse or is not a mapping.
     """
-    errors = []
-    warnings = []
+    global _yaml_cache_version
+    if _yaml_cache_version != brain_config.cache_version:
+        _YAML_CACHE.clear()
+        _yaml_cache_version = brain_config.cache_version
+
+    key = hashlib.blake2b(yaml_content.encode(), digest_size=16).digest()
+    hit = _YAML_CACHE.get(key)
+    if hit is not None:
+        _YAML_CACHE.move_to_end(key)
+        return hit
 
     try:
-        config = yaml.safe_load(request.yaml_content)
+        config = await asyncio.to_thread(yaml.load, yaml_content, _YamlLoader)
     except yaml.YAMLError as e:
-        return BrainConfigValidationResponse(
-            valid=False,
-            errors=[f"YAML parse error: {str(e)}"],
-        )
+        result = (None, [f"YAML parse error: {str(e)}"], [])
+    else:
+        if not isinstance(config, dict):
+            result = (None, ["Configuration must be a YAML object"], [])
+        else:
+            errors, warnings = _validate_parsed(config)
+            result = (config, errors, warnings)
 
-    if not isinstance(config, dict):
-        return BrainConfigValidationResponse(
-            valid=False,
-            errors=["Configuration must be a YAML object"],
-        )
+    _YAML_CACHE[key] = result
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    return result
+
+
+def _validate_parsed(config: dict) -> tuple:
+    """
+    Validate an already-parsed configuration dict.
+
+    Shared by the /validate endpoint and /import, which parses the YAML
+    once and reuses the dict instead of re-parsing the payload.
+
+    Returns:
+        (errors, warnings) lists.
+    """
+    errors = []
+    warnings = []
 
-    # Validate scoring weights
+    # Validate scoring weights — dict keys view is set-like, so the
+    # difference runs in C in one shot; sorted for stable warning order
     scoring = config.get("scoring", {})
     weights = scoring.get("weights", {})
-    required_weights = ["base_priority", "missing_slot", "risk", "round_fit", "asked_penalty"]
-    for w in required_weights:
-        if w not in weights:
-            warnings.append(f"Missing scoring weight: {w}")
+    for w in sorted(REQUIRED_WEIGHTS - weights.keys()):
+        warnings.append(f"Missing scoring weight: {w}")
 
-    # Validate slots
+    # Validate slots. Duplicate detection fast-paths through a set
+    # comprehension (runs in C); the per-item loop that pinpoints the
+    # offenders only runs when the counts disagree.
     slots = config.get("slots", [])
     if not slots:
         warnings.append("No slots defined")
     else:
-        slot_keys = set()
         for i, slot in enumerate(slots):
             if "key" not in slot:
                 errors.append(f"Slot {i} missing 'key' field")
-            else:
-                if slot["key"] in slot_keys:
-                    errors.append(f"Duplicate slot key: {slot['key']}")
-                slot_keys.add(slot["key"])
+        slot_keys = [slot["key"] for slot in slots if "key" in slot]
+        if len(slot_keys) != len(set(slot_keys)):
+            seen = set()
+            for key in slot_keys:
+                if key in seen:
+                    errors.append(f"Duplicate slot key: {key}")
+                seen.add(key)
 
     # Validate questions
     questions = config.get("questions", [])
     if len(questions) < 9:
         warnings.append(f"Only {len(questions)} questions defined; recommend 20+ for effective scoring")
 
-    question_ids = set()
     for i, q in enumerate(questions):
         if "id" not in q:
             errors.append(f"Question {i} missing 'id' field")
-        else:
-            if q["id"] in question_ids:
-                errors.append(f"Duplicate question id: {q['id']}")
-            question_ids.add(q["id"])
-
         if "text_lt" not in q and "text_en" not in q:
             errors.append(f"Question {q.get('id', i)} has no text")
+    question_ids = [q["id"] for q in questions if "id" in q]
+    if len(question_ids) != len(set(question_ids)):
+        seen = set()
+        for qid in question_ids:
+            if qid in seen:
+                errors.append(f"Duplicate question id: {qid}")
+            seen.add(qid)
 
     # Validate risk rules
     risk_rules = config.get("risk_rules", [])
-    rule_ids = set()
     for i, rule in enumerate(risk_rules):
         if "id" not in rule:
             errors.append(f"Risk rule {i} missing 'id' field")
-        else:
-            if rule["id"] in rule_ids:
-                errors.append(f"Duplicate risk rule id: {rule['id']}")
-            rule_ids.add(rule["id"])
-
         if "rule_json" not in rule:
             errors.append(f"Risk rule {rule.get('id', i)} missing 'rule_json'")
+    rule_ids = [rule["id"] for rule in risk_rules if "id" in rule]
+    if len(rule_ids) != len(set(rule_ids)):
+        seen = set()
+        for rid in rule_ids:
+            if rid in seen:
+                errors.append(f"Duplicate risk rule id: {rid}")
+            seen.add(rid)
+
+    return errors, warnings
+
+
+@router.post("/validate", response_model=BrainConfigValidationResponse)
+async def validate_config(
+    request: BrainConfigImportRequest,
+    _: bool = Depends(verify_admin_key),
+):
+    """
+    Validate YAML configuration without saving.
+    """
+    if len(request.yaml_content) > _MAX_YAML_BYTES:
+        return BrainConfigValidationResponse(
+            valid=False,
+            errors=[f"Configuration too large (max {_MAX_YAML_BYTES} bytes)"],
+        )
 
+    _config, errors, warnings = await _parse_and_validate(request.yaml_content)
     return BrainConfigValidationResponse(
         valid=len(errors) == 0,
         errors=errors,
@@ -352,62 +481,140 @@ async def validate_config(
     )
 
 
+# Upsert statements compiled once at import with explicit bind types,
+# so per-call type sniffing is skipped; the inline import json that
+# used to live in this endpoint was hoisted out earlier (orjson at module
+# scope), and hoisting the TextClause construction finishes the job
+_SQL_UPSERT_SCORING = text("""
+    INSERT INTO brain_scoring_config (config_key, weights, updated_at)
+    VALUES ('default', :weights, NOW())
+    ON CONFLICT (config_key)
+    DO UPDATE SET weights = EXCLUDED.weights, updated_at = NOW()
+""")
+
+_SQL_UPSERT_SLOT = text("""
+    INSERT INTO brain_slots (slot_key, label_lt, label_en, description, is_required, priority_weight, updated_at)
+    VALUES (:key, :label_lt, :label_en, :description, :is_required, :priority_weight, NOW())
+    ON CONFLICT (slot_key)
+    DO UPDATE SET
+        label_lt = EXCLUDED.label_lt,
+        label_en = EXCLUDED.label_en,
+        description = EXCLUDED.description,
+        is_required = EXCLUDED.is_required,
+        priority_weight = EXCLUDED.priority_weight,
+        updated_at = NOW()
+""").bindparams(
+    bindparam("is_required", type_=Boolean),
+    bindparam("priority_weight", type_=Float),
+)
+
+_SQL_UPSERT_QUESTION = text("""
+    INSERT INTO brain_questions (question_id, text_lt, text_en, base_priority, round_hint, slot_coverage, risk_coverage, enabled, updated_at)
+    VALUES (:id, :text_lt, :text_en, :base_priority, :round_hint, :slot_coverage, :risk_coverage, :enabled, NOW())
+    ON CONFLICT (question_id)
+    DO UPDATE SET
+        text_lt = EXCLUDED.text_lt,
+        text_en = EXCLUDED.text_en,
+        base_priority = EXCLUDED.base_priority,
+        round_hint = EXCLUDED.round_hint,
+        slot_coverage = EXCLUDED.slot_coverage,
+        risk_coverage = EXCLUDED.risk_coverage,
+        enabled = EXCLUDED.enabled,
+        updated_at = NOW()
+""").bindparams(
+    bindparam("base_priority", type_=Integer),
+    bindparam("slot_coverage", type_=ARRAY(String)),
+    bindparam("risk_coverage", type_=ARRAY(String)),
+    bindparam("enabled", type_=Boolean),
+)
+
+_SQL_UPSERT_RISK_RULE = text("""
+    INSERT INTO brain_risk_rules (rule_id, code, severity, rule_json, note_template, enabled)
+    VALUES (:id, :code, :severity, :rule_json, :note_template, :enabled)
+    ON CONFLICT (rule_id)
+    DO UPDATE SET
+        code = EXCLUDED.code,
+        severity = EXCLUDED.severity,
+        rule_json = EXCLUDED.rule_json,
+        note_template = EXCLUDED.note_template,
+        enabled = EXCLUDED.enabled
+""").bindparams(
+    bindparam("enabled", type_=Boolean),
+)
+
+_SQL_UPSERT_MODES_QUICK = text("""
+    INSERT INTO brain_config (key, value, updated_at)
+    VALUES ('modes_quick', :value, NOW())
+    ON CONFLICT (key)
+    DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()
+""")
+
+_SQL_UPSERT_SKIP_RULE = text("""
+    INSERT INTO brain_skip_rules (rule_id, condition_slot, condition_type, condition_values, skip_question_ids, enabled)
+    VALUES (:id, :condition_slot, :condition_type, :condition_values, :skip_question_ids, :enabled)
+    ON CONFLICT (rule_id)
+    DO UPDATE SET
+        condition_slot = EXCLUDED.condition_slot,
+        condition_type = EXCLUDED.condition_type,
+        condition_values = EXCLUDED.condition_values,
+        skip_question_ids = EXCLUDED.skip_question_ids,
+        enabled = EXCLUDED.enabled
+""").bindparams(
+    bindparam("condition_values", type_=ARRAY(String)),
+    bindparam("skip_question_ids", type_=ARRAY(String)),
+    bindparam("enabled", type_=Boolean),
+)
+
+
 @router.post("/import", response_model=BrainConfigImportResponse)
 async def import_config(
     request: BrainConfigImportRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
     _: bool = Depends(verify_admin_key),
 ):
     """
     Import YAML configuration into the database (upsert).
     """
-    # First validate
-    validation = await validate_config(request, _)
-    if not validation.valid:
+    if len(request.yaml_content) > _MAX_YAML_BYTES:
         raise HTTPException(
-            status_code=400,
-            detail={"message": "Validation failed", "errors": validation.errors},
+            status_code=413,
+            detail=f"Configuration too large (max {_MAX_YAML_BYTES} bytes)",
         )
 
-    try:
-        config = yaml.safe_load(request.yaml_content)
-    except yaml.YAMLError as e:
-        raise HTTPException(status_code=400, detail=f"YAML parse error: {str(e)}")
-
-    slots_imported = 0
-    questions_imported = 0
-    risk_rules_imported = 0
-
-    try:
-        # Import scoring weights
-        weights = config.get("scoring", {}).get("weights", {})
-        if weights:
-            import json
-            await db.execute(
-                text("""
-                    INSERT INTO brain_scoring_config (config_key, weights, updated_at)
-                    VALUES ('default', :weights, NOW())
-                    ON CONFLICT (config_key)
-                    DO UPDATE SET weights = EXCLUDED.weights, updated_at = NOW()
-                """),
-                {"weights": json.dumps(weights)},
-            )
+    # Parse + validate via the shared memoized helper: a retried import
+    # of the same document skips both entirely
+    config, errors, _warnings = await _parse_and_validate(request.yaml_content)
+    if config is None:
+        raise HTTPException(status_code=400, detail=errors[0])
+    if errors:
+        raise HTTPException(
+            status_code=400,
+            detail={"message": "Validation failed", "errors": errors},
+        )
 
-        # Import slots
-        for slot in config.get("slots", []):
-            await db.execute(
-                text("""
-                    INSERT INTO brain_slots (slot_key, label_lt, label_en, description, is_required, priority_weight, updated_at)
-                    VALUES (:key, :label_lt, :label_en, :description, :is_required, :priority_weight, NOW())
-                    ON CONFLICT (slot_key)
-                    DO UPDATE SET
-                        label_lt = EXCLUDED.label_lt,
-                        label_en = EXCLUDED.label_en,
-                        description = EXCLUDED.description,
-                        is_required = EXCLUDED.is_required,
-                        priority_weight = EXCLUDED.priority_weight,
-                        updated_at = NOW()
-                """),
+    async with _import_lock:
+        try:
+            # Cluster-wide mutual exclusion; released automatically when
+            # this transaction commits or rolls back
+            await db.execute(text("SELECT pg_advisory_xact_lock(hashtext('brain_import'))"))
+
+            # All upserts share the request session's single transaction and
+            # commit (one WAL fsync). Relax durability for this transaction
+            # only: if the server crashes mid-import the admin simply retries.
+            await db.execute(text("SET LOCAL synchronous_commit = OFF"))
+
+            # Import scoring weights
+            weights = config.get("scoring", {}).get("weights", {})
+            if weights:
+                await db.execute(
+                    _SQL_UPSERT_SCORING,
+                    {"weights": orjson.dumps(weights).decode()},
+                )
+
+            # Import slots — one executemany per table instead of one
+            # round-trip per row; asyncpg pipelines the whole batch
+            slot_rows = [
                 {
                     "key": slot["key"],
                     "label_lt": slot.get("label_lt"),
@@ -415,27 +622,18 @@ async def import_config(
                     "description": slot.get("description"),
                     "is_required": slot.get("is_required", False),
                     "priority_weight": slot.get("priority_weight", 1.0),
-                },
-            )
-            slots_imported += 1
-
-        # Import questions
-        for q in config.get("questions", []):
-            await db.execute(
-                text("""
-                    INSERT INTO brain_questions (question_id, text_lt, text_en, base_priority, round_hint, slot_coverage, risk_coverage, enabled, updated_at)
-                    VALUES (:id, :text_lt, :text_en, :base_priority, :round_hint, :slot_coverage, :risk_coverage, :enabled, NOW())
-                    ON CONFLICT (question_id)
-                    DO UPDATE SET
-                        text_lt = EXCLUDED.text_lt,
-                        text_en = EXCLUDED.text_en,
-                        base_priority = EXCLUDED.base_priority,
-                        round_hint = EXCLUDED.round_hint,
-                        slot_coverage = EXCLUDED.slot_coverage,
-                        risk_coverage = EXCLUDED.risk_coverage,
-                        enabled = EXCLUDED.enabled,
-                        updated_at = NOW()
-                """),
+                }
+                for slot in config.get("slots", [])
+            ]
+            if slot_rows:
+                await db.execute(
+                    _SQL_UPSERT_SLOT,
+                    slot_rows,
+                )
+            slots_imported = len(slot_rows)
+
+            # Import questions
+            question_rows = [
                 {
                     "id": q["id"],
                     "text_lt": q.get("text_lt"),
@@ -445,64 +643,46 @@ async def import_config(
                     "slot_coverage": q.get("slot_coverage", []),
                     "risk_coverage": q.get("risk_coverage", []),
                     "enabled": q.get("enabled", True),
-                },
-            )
-            questions_imported += 1
-
-        # Import risk rules
-        import json
-        for rule in config.get("risk_rules", []):
-            await db.execute(
-                text("""
-                    INSERT INTO brain_risk_rules (rule_id, code, severity, rule_json, note_template, enabled)
-                    VALUES (:id, :code, :severity, :rule_json, :note_template, :enabled)
-                    ON CONFLICT (rule_id)
-                    DO UPDATE SET
-                        code = EXCLUDED.code,
-                        severity = EXCLUDED.severity,
-                        rule_json = EXCLUDED.rule_json,
-                        note_template = EXCLUDED.note_template,
-                        enabled = EXCLUDED.enabled
-                """),
+                }
+                for q in config.get("questions", [])
+            ]
+            if question_rows:
+                await db.execute(
+                    _SQL_UPSERT_QUESTION,
+                    question_rows,
+                )
+            questions_imported = len(question_rows)
+
+            # Import risk rules
+            risk_rule_rows = [
                 {
                     "id": rule["id"],
                     "code": rule.get("code", rule["id"]),
                     "severity": rule.get("severity", "medium"),
-                    "rule_json": json.dumps(rule.get("rule_json", {})),
+                    "rule_json": orjson.dumps(rule.get("rule_json", {})).decode(),
                     "note_template": rule.get("note_template"),
                     "enabled": rule.get("enabled", True),
-                },
-            )
-            risk_rules_imported += 1
-
-        # Import modes.quick policy (stored in brain_config key-value table)
-        modes = config.get("modes", {})
-        quick_policy = modes.get("quick")
-        if quick_policy:
-            await db.execute(
-                text("""
-                    INSERT INTO brain_config (key, value, updated_at)
-                    VALUES ('modes_quick', :value, NOW())
-                    ON CONFLICT (key)
-                    DO UPDATE SET value = EXCLUDED.value, updated_at = NOW()
-                """),
-                {"value": json.dumps(quick_policy)},
-            )
-
-        # Import skip rules if present
-        for skip_rule in config.get("skip_rules", []):
-            await db.execute(
-                text("""
-                    INSERT INTO brain_skip_rules (rule_id, condition_slot, condition_type, condition_values, skip_question_ids, enabled)
-                    VALUES (:id, :condition_slot, :condition_type, :condition_values, :skip_question_ids, :enabled)
-                    ON CONFLICT (rule_id)
-                    DO UPDATE SET
-                        condition_slot = EXCLUDED.condition_slot,
-                        condition_type = EXCLUDED.condition_type,
-                        condition_values = EXCLUDED.condition_values,
-                        skip_question_ids = EXCLUDED.skip_question_ids,
-                        enabled = EXCLUDED.enabled
-                """),
+                }
+                for rule in config.get("risk_rules", [])
+            ]
+            if risk_rule_rows:
+                await db.execute(
+                    _SQL_UPSERT_RISK_RULE,
+                    risk_rule_rows,
+                )
+            risk_rules_imported = len(risk_rule_rows)
+
+            # Import modes.quick policy (stored in brain_config key-value table)
+            modes = config.get("modes", {})
+            quick_policy = modes.get("quick")
+            if quick_policy:
+                await db.execute(
+                    _SQL_UPSERT_MODES_QUICK,
+                    {"value": orjson.dumps(quick_policy).decode()},
+                )
+
+            # Import skip rules if present
+            skip_rule_rows = [
                 {
                     "id": skip_rule["id"],
                     "condition_slot": skip_rule.get("condition_slot"),
@@ -510,18 +690,26 @@ async def import_config(
                     "condition_values": skip_rule.get("condition_values", []),
                     "skip_question_ids": skip_rule.get("skip_question_ids", []),
                     "enabled": skip_rule.get("enabled", True),
-                },
+                }
+                for skip_rule in config.get("skip_rules", [])
+            ]
+            if skip_rule_rows:
+                await db.execute(
+                    _SQL_UPSERT_SKIP_RULE,
+                    skip_rule_rows,
+                )
+
+            # Invalidate after the session commits (commit happens in the
+            # get_db dependency teardown, before background tasks run), so a
+            # concurrent reload cannot repopulate the cache with stale rows
+            background_tasks.add_task(brain_config.invalidate_cache)
+
+            return BrainConfigImportResponse(
+                success=True,
+                slots_imported=slots_imported,
+                questions_imported=questions_imported,
+                risk_rules_imported=risk_rules_imported,
             )
 
-        # Invalidate cache
-        brain_config.invalidate_cache()
-
-        return BrainConfigImportResponse(
-            success=True,
-            slots_imported=slots_imported,
-            questions_imported=questions_imported,
-            risk_rules_imported=risk_rules_imported,
-        )
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
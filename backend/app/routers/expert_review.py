@@ -5,26 +5,44 @@ Allows experts to review completed sessions and provide feedback
 that will be used to improve the skill.
 """
 
-import json
+import asyncio
+import time
 from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
-from app.database import get_db
+from app.database import async_session_maker, get_db
 from app.services.brain import brain_config
 
 router = APIRouter()
 settings = get_settings()
 
 
+# Question lookups keyed by language; identical across requests until
+# the brain config changes, so they are rebuilt only when the config
+# cache version moves (bumped by invalidate_cache on /import)
+_question_lookup_cache: dict = {}
+_question_lookup_version = -1
+
+
 async def _build_question_lookup(db: AsyncSession, language: str) -> dict:
-    """Build a lookup dictionary from question_id to question text."""
+    """Build (and cache) a lookup dictionary from question_id to question text."""
+    global _question_lookup_version
+    if _question_lookup_version != brain_config.cache_version:
+        _question_lookup_cache.clear()
+        _question_lookup_version = brain_config.cache_version
+
+    lookup = _question_lookup_cache.get(language)
+    if lookup is not None:
+        return lookup
+
     await brain_config.load_all(db)
     lookup = {}
     text_field = "text_lt" if language == "lt" else "text_en"
@@ -33,9 +51,73 @@ async def _build_question_lookup(db: AsyncSession, language: str) -> dict:
         text = q.get(text_field) or q.get("text_lt", "")
         if qid and text:
             lookup[qid] = text
+    _question_lookup_cache[language] = lookup
     return lookup
 
 
+# list_sessions SQL variants, precompiled at import time. The keyset
+# predicate is always present — callers without a cursor get sentinel
+# values that match every row — so each filter combination maps to one
+# stable statement text that asyncpg can keep prepared.
+_CURSOR_MAX_CREATED_AT = datetime.max
+_CURSOR_MAX_SESSION_ID = UUID("ffffffff-ffff-ffff-ffff-ffffffffffff")
+
+
+def _build_list_sessions_variants() -> dict:
+    base = """
+        SELECT
+            s.session_id,
+            s.language,
+            s.state->>'interview_mode' as interview_mode,
+            s.created_at,
+            s.completed_at,
+            s.final_report IS NOT NULL as has_report,
+            (er.sid IS NOT NULL) as has_review,
+            s.questions_count,
+            s.slots_filled_count as slots_filled,
+            s.state->'contact_info'->>'name' as contact_name
+        FROM sessions s
+        LEFT JOIN LATERAL (
+            SELECT er.session_id AS sid
+            FROM expert_reviews er
+            WHERE er.session_id = s.session_id
+            LIMIT 1
+        ) er ON true
+        WHERE (s.created_at, s.session_id) < (:cursor_created_at, :cursor_session_id)
+    """
+    variants = {}
+    for completed_only in (True, False):
+        for has_review in (None, True, False):
+            for has_language in (True, False):
+                query = base
+                if completed_only:
+                    query += " AND s.completed_at IS NOT NULL"
+                if has_review is True:
+                    # Reuse the lateral probe instead of a second correlated EXISTS
+                    query += " AND er.sid IS NOT NULL"
+                elif has_review is False:
+                    query += " AND er.sid IS NULL"
+                if has_language:
+                    query += " AND s.language = :language"
+                query += " ORDER BY s.created_at DESC, s.session_id DESC LIMIT :limit OFFSET :offset"
+                variants[(completed_only, has_review, has_language)] = text(query)
+    return variants
+
+
+_LIST_SESSIONS_VARIANTS = _build_list_sessions_variants()
+
+
+async def _fetch_rows(sql: str, params: dict) -> list:
+    """Run a read-only query on its own pooled session.
+
+    A single AsyncSession cannot execute concurrently, so queries that
+    are gathered in parallel each get their own session here.
+    """
+    async with async_session_maker() as session:
+        result = await session.execute(text(sql), params)
+        return result.fetchall()
+
+
 async def verify_admin_key(x_admin_key: str = Header(...)):
     """Verify the admin API key."""
     if x_admin_key != settings.admin_api_key:
@@ -120,6 +202,103 @@ class ExpertReviewResponse(BaseModel):
     message: str
 
 
+# Hot statements compiled once at import; asyncpg's statement cache then
+# reuses one server-side prepared plan per query. list_sessions keeps
+# its dynamic WHERE build — each filter combination yields a stable
+# string, so it hits the same cache per variant.
+# The state blob also holds transcripts and bookkeeping the review view
+# never shows — extract just the needed paths in SQL so the full jsonb
+# is neither shipped nor re-parsed in Python
+_SESSION_FETCH_SQL = text("""
+    SELECT
+        s.session_id,
+        s.language,
+        s.state->'history',
+        s.state->'slots',
+        s.state->'contact_info',
+        s.state->'risk_flags',
+        s.state->>'interview_mode',
+        s.created_at,
+        s.completed_at,
+        s.final_report
+    FROM sessions s
+    WHERE s.session_id = :id
+""")
+
+_REVIEW_HEAD_SQL = """
+    SELECT
+        er.id,
+        er.reviewer_name,
+        er.overall_rating,
+        er.overall_comments,
+        er.created_at
+    FROM expert_reviews er
+    WHERE er.session_id = :id
+    ORDER BY er.created_at DESC
+    LIMIT 1
+"""
+
+_QUESTION_REVIEWS_SQL = """
+    SELECT
+        question_id,
+        original_question,
+        user_response,
+        effectiveness_rating,
+        what_could_be_better,
+        suggested_alternative,
+        missed_opportunities
+    FROM question_reviews
+    WHERE expert_review_id = :review_id
+"""
+
+_SUMMARY_REVIEW_SQL = """
+    SELECT
+        original_summary,
+        accuracy_rating,
+        completeness_rating,
+        what_could_be_better,
+        missing_insights
+    FROM summary_reviews
+    WHERE expert_review_id = :review_id
+    LIMIT 1
+"""
+
+# Guarded insert: the WHERE clause folds the "session exists" and
+# "no review yet" checks into the statement itself, so the happy path
+# costs one round-trip; RETURNING yields no row when either guard fails
+_INSERT_REVIEW_SQL = text("""
+    INSERT INTO expert_reviews (session_id, reviewer_name, overall_rating, overall_comments)
+    SELECT :session_id, :reviewer_name, :overall_rating, :overall_comments
+    WHERE EXISTS (SELECT 1 FROM sessions WHERE session_id = :session_id)
+      AND NOT EXISTS (SELECT 1 FROM expert_reviews WHERE session_id = :session_id)
+    RETURNING id
+""")
+
+_INSERT_QUESTION_REVIEWS_SQL = text("""
+    INSERT INTO question_reviews (
+        expert_review_id, question_id, original_question, user_response,
+        effectiveness_rating, what_could_be_better, suggested_alternative,
+        missed_opportunities
+    )
+    VALUES (
+        :review_id, :question_id, :original_question, :user_response,
+        :effectiveness_rating, :what_could_be_better, :suggested_alternative,
+        :missed_opportunities
+    )
+""")
+
+_INSERT_SUMMARY_REVIEW_SQL = text("""
+    INSERT INTO summary_reviews (
+        expert_review_id, original_summary, accuracy_rating,
+        completeness_rating, what_could_be_better, missing_insights
+    )
+    VALUES (
+        :review_id, :original_summary, :accuracy_rating,
+        :completeness_rating, :what_could_be_better, :missing_insights
+    )
+""")
+
+
 # ============================================
 # Endpoints
 # ============================================
@@ -131,60 +310,50 @@ async def list_sessions(
     completed_only: bool = Query(True),
     has_review: Optional[bool] = Query(None),
     language: Optional[str] = Query(None),
+    cursor_created_at: Optional[datetime] = Query(None),
+    cursor_session_id: Optional[UUID] = Query(None),
     db: AsyncSession = Depends(get_db),
     _: bool = Depends(verify_admin_key),
 ):
     """
     List sessions available for expert review.
 
+    Supports keyset pagination: pass the last row's created_at and
+    session_id as cursor_created_at/cursor_session_id to fetch the next
+    page in O(limit) regardless of depth; plain offset paging is kept
+    for backward compatibility.
+
     Args:
         limit: Max results to return
-        offset: Pagination offset
+        offset: Pagination offset (ignored when a cursor is given)
         completed_only: Only show completed sessions (default True)
         has_review: Filter by whether session has been reviewed
         language: Filter by language (lt, en, ru)
+        cursor_created_at: Keyset cursor - created_at of the last row seen
+        cursor_session_id: Keyset cursor - session_id of the last row seen
     """
-    query = """
-        SELECT
-            s.session_id,
-            s.language,
-            s.state->>'interview_mode' as interview_mode,
-            s.created_at,
-            s.completed_at,
-            s.final_report IS NOT NULL as has_report,
-            EXISTS(SELECT 1 FROM expert_reviews er WHERE er.session_id = s.session_id) as has_review,
-            COALESCE(jsonb_array_length(s.state->'history'), 0) / 2 as questions_count,
-            (
-                SELECT COUNT(*)
-                FROM jsonb_each(s.state->'slots') slot
-                WHERE (slot.value->>'confidence')::float >= 0.7
-            ) as slots_filled,
-            s.state->'contact_info'->>'name' as contact_name
-        FROM sessions s
-        WHERE 1=1
-    """
-    params = {"limit": limit, "offset": offset}
-
-    if completed_only:
-        query += " AND s.completed_at IS NOT NULL"
-
-    if has_review is not None:
-        if has_review:
-            query += " AND EXISTS(SELECT 1 FROM expert_reviews er WHERE er.session_id = s.session_id)"
-        else:
-            query += " AND NOT EXISTS(SELECT 1 FROM expert_reviews er WHERE er.session_id = s.session_id)"
-
-    if language:
-        query += " AND s.language = :language"
+    params = {
+        "limit": limit,
+        "offset": offset,
+        "cursor_created_at": _CURSOR_MAX_CREATED_AT,
+        "cursor_session_id": _CURSOR_MAX_SESSION_ID,
+    }
+    if language is not None:
         params["language"] = language
-
-    query += " ORDER BY s.created_at DESC LIMIT :limit OFFSET :offset"
-
-    result = await db.execute(text(query), params)
+    if cursor_created_at is not None and cursor_session_id is not None:
+        # Keyset pagination: strictly before the cursor row
+        params["cursor_created_at"] = cursor_created_at
+        params["cursor_session_id"] = cursor_session_id
+        params["offset"] = 0
+
+    query = _LIST_SESSIONS_VARIANTS[(completed_only, has_review, language is not None)]
+    result = await db.execute(query, params)
     rows = result.fetchall()
 
+    # model_construct skips per-field validation; the values come
+    # straight from typed DB columns
     return [
-        SessionListItem(
+        SessionListItem.model_construct(
             session_id=row[0],
             language=row[1] or 'lt',
             interview_mode=row[2] or 'quick',
@@ -212,62 +381,56 @@ async def get_session_for_review(
     Returns all questions asked, user answers, extracted slots,
     final report, and any existing review.
     """
-    # Get session data
-    result = await db.execute(
-        text("""
-            SELECT
-                s.session_id,
-                s.language,
-                s.state,
-                s.created_at,
-                s.completed_at,
-                s.final_report
-            FROM sessions s
-            WHERE s.session_id = :id
-        """),
-        {"id": session_id},
+    # Session data and latest review head are independent — fetch them
+    # concurrently (the review query runs on its own session)
+    result, review_rows = await asyncio.gather(
+        db.execute(_SESSION_FETCH_SQL, {"id": session_id}),
+        _fetch_rows(_REVIEW_HEAD_SQL, {"id": session_id}),
     )
     row = result.fetchone()
     if not row:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    state = row[2] if isinstance(row[2], dict) else json.loads(row[2])
+    def _jsonb(value, default):
+        # asyncpg normally hands jsonb over as Python objects already
+        if value is None:
+            return default
+        if isinstance(value, (dict, list)):
+            return value
+        return orjson.loads(value)
 
     # Extract question-answer pairs from history
-    history = state.get("history", [])
+    history = _jsonb(row[2], [])
     questions_answers = []
 
     # Check if history has agent messages (new format) or only user messages (legacy)
     has_agent_messages = any(entry.get("role") == "agent" for entry in history)
 
     if has_agent_messages:
-        # New format: match questions to answers by question_id
-        # Build a lookup of agent questions by question_id
+        # New format: match questions to answers by question_id in a
+        # single pass — the agent question always precedes its answer in
+        # the history, so the lookup fills in as we walk
         agent_questions = {}
         for entry in history:
-            if entry.get("role") == "agent":
+            role = entry.get("role")
+            if role == "agent":
                 qid = entry.get("question_id", "unknown")
-                agent_questions[qid] = {
-                    "question_id": qid,
-                    "question_text": entry.get("text", ""),
-                    "round": entry.get("round", 1),
-                }
-
-        # Match user answers to questions by question_id
-        for entry in history:
-            if entry.get("role") == "user":
+                agent_questions[qid] = (entry.get("text", ""), entry.get("round", 1))
+            elif role == "user":
                 qid = entry.get("question_id", "unknown")
-                if qid in agent_questions:
-                    q = agent_questions[qid]
-                    questions_answers.append(QuestionAnswer(
-                        question_id=q["question_id"],
-                        question_text=q["question_text"],
+                # model_construct skips field validation — the history
+                # values are already trusted strings/ints
+                q = agent_questions.get(qid)
+                if q is not None:
+                    questions_answers.append(QuestionAnswer.model_construct(
+                        question_id=qid,
+                        question_text=q[0],
                         answer_text=entry.get("text", ""),
-                        round=q["round"],
+                        round=q[1],
                     ))
                 else:
                     # User answer without matching agent question (shouldn't happen)
-                    questions_answers.append(QuestionAnswer(
+                    questions_answers.append(QuestionAnswer.model_construct(
                         question_id=qid,
                         question_text=f"[Question ID: {qid}]",
                         answer_text=entry.get("text", ""),
@@ -278,59 +441,37 @@ async def get_session_for_review(
         session_language = row[1] or 'lt'
         question_lookup = await _build_question_lookup(db, session_language)
 
-        for entry in history:
-            if entry.get("role") == "user":
-                question_id = entry.get("question_id", "unknown")
-                # Look up actual question text from brain config
-                if question_id in question_lookup:
-                    question_text = question_lookup[question_id]
-                elif question_id.startswith("AI_FOLLOWUP"):
-                    # AI-generated questions - text not stored in legacy sessions
-                    question_text = "[AI-generated follow-up question - text not recorded in legacy sessions]"
-                else:
-                    question_text = f"[Question ID: {question_id}]"
-
-                questions_answers.append(QuestionAnswer(
-                    question_id=question_id,
-                    question_text=question_text,
-                    answer_text=entry.get("text", ""),
-                    round=entry.get("round", 1),
-                ))
+        def _legacy_question_text(question_id: str) -> str:
+            # Look up actual question text from brain config
+            if question_id in question_lookup:
+                return question_lookup[question_id]
+            if question_id.startswith("AI_FOLLOWUP"):
+                # AI-generated questions - text not stored in legacy sessions
+                return "[AI-generated follow-up question - text not recorded in legacy sessions]"
+            return f"[Question ID: {question_id}]"
+
+        # List comprehension + model_construct keeps this pure-Python
+        # loop cheap on long histories (no per-entry validation)
+        questions_answers = [
+            QuestionAnswer.model_construct(
+                question_id=(qid := entry.get("question_id", "unknown")),
+                question_text=_legacy_question_text(qid),
+                answer_text=entry.get("text", ""),
+                round=entry.get("round", 1),
+            )
+            for entry in history
+            if entry.get("role") == "user"
+        ]
 
     # Get existing review if any
     existing_review = None
-    review_result = await db.execute(
-        text("""
-            SELECT
-                er.id,
-                er.reviewer_name,
-                er.overall_rating,
-                er.overall_comments,
-                er.created_at
-            FROM expert_reviews er
-            WHERE er.session_id = :id
-            ORDER BY er.created_at DESC
-            LIMIT 1
-        """),
-        {"id": session_id},
-    )
-    review_row = review_result.fetchone()
+    review_row = review_rows[0] if review_rows else None
     if review_row:
-        # Get question reviews
-        qr_result = await db.execute(
-            text("""
-                SELECT
-                    question_id,
-                    original_question,
-                    user_response,
-                    effectiveness_rating,
-                    what_could_be_better,
-                    suggested_alternative,
-                    missed_opportunities
-                FROM question_reviews
-                WHERE expert_review_id = :review_id
-            """),
-            {"review_id": review_row[0]},
+        # Question and summary reviews only depend on the review id —
+        # fetch them concurrently as well
+        qr_rows, sr_rows = await asyncio.gather(
+            _fetch_rows(_QUESTION_REVIEWS_SQL, {"review_id": review_row[0]}),
+            _fetch_rows(_SUMMARY_REVIEW_SQL, {"review_id": review_row[0]}),
         )
         question_reviews = [
             {
@@ -342,25 +483,10 @@ async def get_session_for_review(
                 "suggested_alternative": qr[5],
                 "missed_opportunities": qr[6],
             }
-            for qr in qr_result.fetchall()
+            for qr in qr_rows
         ]
 
-        # Get summary review
-        sr_result = await db.execute(
-            text("""
-                SELECT
-                    original_summary,
-                    accuracy_rating,
-                    completeness_rating,
-                    what_could_be_better,
-                    missing_insights
-                FROM summary_reviews
-                WHERE expert_review_id = :review_id
-                LIMIT 1
-            """),
-            {"review_id": review_row[0]},
-        )
-        sr_row = sr_result.fetchone()
+        sr_row = sr_rows[0] if sr_rows else None
         summary_review = None
         if sr_row:
             summary_review = {
@@ -384,14 +510,14 @@ async def get_session_for_review(
     return SessionReviewData(
         session_id=row[0],
         language=row[1] or 'lt',
-        interview_mode=state.get("interview_mode", "quick"),
-        created_at=row[3],
-        completed_at=row[4],
-        contact_info=state.get("contact_info"),
+        interview_mode=row[6] or "quick",
+        created_at=row[7],
+        completed_at=row[8],
+        contact_info=_jsonb(row[4], None),
         questions_answers=questions_answers,
-        slots=state.get("slots", {}),
-        risk_flags=state.get("risk_flags", []),
-        final_report=row[5],
+        slots=_jsonb(row[3], {}),
+        risk_flags=_jsonb(row[5], []),
+        final_report=row[9],
         existing_review=existing_review,
     )
 
@@ -411,32 +537,10 @@ async def submit_expert_review(
     - Individual question reviews with ratings and improvement suggestions
     - Summary/report review with accuracy and completeness ratings
     """
-    # Verify session exists
-    result = await db.execute(
-        text("SELECT session_id FROM sessions WHERE session_id = :id"),
-        {"id": session_id},
-    )
-    if not result.fetchone():
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    # Check if review already exists
-    existing = await db.execute(
-        text("SELECT id FROM expert_reviews WHERE session_id = :id"),
-        {"id": session_id},
-    )
-    if existing.fetchone():
-        raise HTTPException(
-            status_code=400,
-            detail="Review already exists for this session. Use PUT to update."
-        )
-
-    # Create expert review
+    # Create expert review; existence and duplicate checks are built
+    # into the statement (see _INSERT_REVIEW_SQL)
     result = await db.execute(
-        text("""
-            INSERT INTO expert_reviews (session_id, reviewer_name, overall_rating, overall_comments)
-            VALUES (:session_id, :reviewer_name, :overall_rating, :overall_comments)
-            RETURNING id
-        """),
+        _INSERT_REVIEW_SQL,
         {
             "session_id": session_id,
             "reviewer_name": review.reviewer_name,
@@ -444,48 +548,45 @@ async def submit_expert_review(
             "overall_comments": review.overall_comments,
         },
     )
-    review_id = result.scalar_one()
+    review_id = result.scalar_one_or_none()
+    if review_id is None:
+        # Error path only: one extra query to tell 404 from duplicate
+        exists = await db.execute(
+            text("SELECT 1 FROM sessions WHERE session_id = :id"),
+            {"id": session_id},
+        )
+        if not exists.fetchone():
+            raise HTTPException(status_code=404, detail="Session not found")
+        raise HTTPException(
+            status_code=400,
+            detail="Review already exists for this session. Use PUT to update."
+        )
 
-    # Insert question reviews
-    for qr in review.question_reviews:
+    # Insert question reviews in one executemany batch — a review of a
+    # typical interview carries 10-30 of them, and per-row awaits would
+    # pay a round-trip each
+    if review.question_reviews:
         await db.execute(
-            text("""
-                INSERT INTO question_reviews (
-                    expert_review_id, question_id, original_question, user_response,
-                    effectiveness_rating, what_could_be_better, suggested_alternative,
-                    missed_opportunities
-                )
-                VALUES (
-                    :review_id, :question_id, :original_question, :user_response,
-                    :effectiveness_rating, :what_could_be_better, :suggested_alternative,
-                    :missed_opportunities
-                )
-            """),
-            {
-                "review_id": review_id,
-                "question_id": qr.question_id,
-                "original_question": qr.original_question,
-                "user_response": qr.user_response,
-                "effectiveness_rating": qr.effectiveness_rating,
-                "what_could_be_better": qr.what_could_be_better,
-                "suggested_alternative": qr.suggested_alternative,
-                "missed_opportunities": qr.missed_opportunities or [],
-            },
+            _INSERT_QUESTION_REVIEWS_SQL,
+            [
+                {
+                    "review_id": review_id,
+                    "question_id": qr.question_id,
+                    "original_question": qr.original_question,
+                    "user_response": qr.user_response,
+                    "effectiveness_rating": qr.effectiveness_rating,
+                    "what_could_be_better": qr.what_could_be_better,
+                    "suggested_alternative": qr.suggested_alternative,
+                    "missed_opportunities": qr.missed_opportunities or [],
+                }
+                for qr in review.question_reviews
+            ],
         )
 
     # Insert summary review if provided
     if review.summary_review:
         await db.execute(
-            text("""
-                INSERT INTO summary_reviews (
-                    expert_review_id, original_summary, accuracy_rating,
-                    completeness_rating, what_could_be_better, missing_insights
-                )
-                VALUES (
-                    :review_id, :original_summary, :accuracy_rating,
-                    :completeness_rating, :what_could_be_better, :missing_insights
-                )
-            """),
+            _INSERT_SUMMARY_REVIEW_SQL,
             {
                 "review_id": review_id,
                 "original_summary": review.summary_review.original_summary,
@@ -496,6 +597,10 @@ async def submit_expert_review(
             },
         )
 
+    # New review changes the aggregates — drop the stats cache
+    global _stats_cache
+    _stats_cache = None
+
     return ExpertReviewResponse(
         success=True,
         review_id=review_id,
@@ -503,6 +608,13 @@ async def submit_expert_review(
     )
 
 
+# Review stats tolerate seconds-level staleness; a short TTL avoids
+# re-running the aggregates on every dashboard refresh. Submitting a
+# review drops the cache immediately.
+_STATS_TTL_SECONDS = 30
+_stats_cache: Optional[tuple] = None  # (monotonic timestamp, payload)
+
+
 @router.get("/reviews/stats")
 async def get_review_stats(
     db: AsyncSession = Depends(get_db),
@@ -516,54 +628,40 @@ async def get_review_stats(
     - Average ratings
     - Common improvement suggestions
     """
-    # Get overall stats
+    global _stats_cache
+    if _stats_cache is not None and time.monotonic() - _stats_cache[0] < _STATS_TTL_SECONDS:
+        return _stats_cache[1]
+
+    # All three aggregates in one round-trip via scalar subqueries
     result = await db.execute(
         text("""
             SELECT
-                COUNT(*) as total_reviews,
-                COALESCE(AVG(overall_rating), 0) as avg_overall_rating
-            FROM expert_reviews
+                (SELECT COUNT(*) FROM expert_reviews),
+                (SELECT COALESCE(AVG(overall_rating), 0) FROM expert_reviews),
+                (SELECT COUNT(*) FROM question_reviews),
+                (SELECT COALESCE(AVG(effectiveness_rating), 0) FROM question_reviews),
+                (SELECT COUNT(*) FROM summary_reviews),
+                (SELECT COALESCE(AVG(accuracy_rating), 0) FROM summary_reviews),
+                (SELECT COALESCE(AVG(completeness_rating), 0) FROM summary_reviews)
         """)
     )
     row = result.fetchone()
 
-    # Get question review stats
-    qr_result = await db.execute(
-        text("""
-            SELECT
-                COUNT(*) as total_question_reviews,
-                COALESCE(AVG(effectiveness_rating), 0) as avg_effectiveness
-            FROM question_reviews
-        """)
-    )
-    qr_row = qr_result.fetchone()
-
-    # Get summary review stats
-    sr_result = await db.execute(
-        text("""
-            SELECT
-                COUNT(*) as total_summary_reviews,
-                COALESCE(AVG(accuracy_rating), 0) as avg_accuracy,
-                COALESCE(AVG(completeness_rating), 0) as avg_completeness
-            FROM summary_reviews
-        """)
-    )
-    sr_row = sr_result.fetchone()
-
-    # Get common improvement suggestions (most frequent words in what_could_be_better)
-    return {
+    stats = {
         "total_reviews": row[0],
         "avg_overall_rating": round(float(row[1]), 2),
         "question_reviews": {
-            "total": qr_row[0],
-            "avg_effectiveness": round(float(qr_row[1]), 2),
+            "total": row[2],
+            "avg_effectiveness": round(float(row[3]), 2),
         },
         "summary_reviews": {
-            "total": sr_row[0],
-            "avg_accuracy": round(float(sr_row[1]), 2),
-            "avg_completeness": round(float(sr_row[2]), 2),
+            "total": row[4],
+            "avg_accuracy": round(float(row[5]), 2),
+            "avg_completeness": round(float(row[6]), 2),
         },
     }
+    _stats_cache = (time.monotonic(), stats)
+    return stats
 
 
 class DeleteSessionResponse(BaseModel):
@@ -591,50 +689,37 @@ async def delete_session(
 
     This action cannot be undone.
     """
-    # Verify session exists
+    # One statement for the whole teardown: explicit deletes with
+    # RETURNING replace the existence check, three COUNT round-trips and
+    # two separate DELETEs. question_reviews / summary_reviews still go
+    # via CASCADE from expert_reviews.
     result = await db.execute(
-        text("SELECT session_id FROM sessions WHERE session_id = :id"),
-        {"id": session_id},
-    )
-    if not result.fetchone():
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    deleted_counts = {}
-
-    # Delete expert reviews first (no CASCADE on this FK)
-    # question_reviews and summary_reviews will be deleted by CASCADE
-    review_result = await db.execute(
-        text("DELETE FROM expert_reviews WHERE session_id = :id"),
-        {"id": session_id},
-    )
-    deleted_counts["expert_reviews"] = review_result.rowcount
-
-    # Delete the session (messages, transcripts, feedback will CASCADE)
-    # Count related records before deletion for reporting
-    msg_count = await db.execute(
-        text("SELECT COUNT(*) FROM messages WHERE session_id = :id"),
-        {"id": session_id},
-    )
-    deleted_counts["messages"] = msg_count.scalar() or 0
-
-    trans_count = await db.execute(
-        text("SELECT COUNT(*) FROM transcripts WHERE session_id = :id"),
+        text("""
+            WITH d_er AS (DELETE FROM expert_reviews WHERE session_id = :id RETURNING 1),
+                 d_m AS (DELETE FROM messages WHERE session_id = :id RETURNING 1),
+                 d_t AS (DELETE FROM transcripts WHERE session_id = :id RETURNING 1),
+                 d_f AS (DELETE FROM feedback WHERE session_id = :id RETURNING 1),
+                 d_s AS (DELETE FROM sessions WHERE session_id = :id RETURNING 1)
+            SELECT (SELECT COUNT(*) FROM d_er),
+                   (SELECT COUNT(*) FROM d_m),
+                   (SELECT COUNT(*) FROM d_t),
+                   (SELECT COUNT(*) FROM d_f),
+                   (SELECT COUNT(*) FROM d_s)
+        """),
         {"id": session_id},
     )
-    deleted_counts["transcripts"] = trans_count.scalar() or 0
+    row = result.fetchone()
 
-    feedback_count = await db.execute(
-        text("SELECT COUNT(*) FROM feedback WHERE session_id = :id"),
-        {"id": session_id},
-    )
-    deleted_counts["feedback"] = feedback_count.scalar() or 0
+    if not row[4]:
+        raise HTTPException(status_code=404, detail="Session not found")
 
-    # Now delete the session (cascades to messages, transcripts, feedback)
-    await db.execute(
-        text("DELETE FROM sessions WHERE session_id = :id"),
-        {"id": session_id},
-    )
-    deleted_counts["sessions"] = 1
+    deleted_counts = {
+        "expert_reviews": row[0],
+        "messages": row[1],
+        "transcripts": row[2],
+        "feedback": row[3],
+        "sessions": row[4],
+    }
 
     await db.commit()
 
@@ -4,16 +4,22 @@ Session Router - Interview Session Management
 Handles the interview flow: start, transcribe, answer, finalize, feedback.
 """
 
-import json
+import asyncio
+import time as _time
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+import msgspec
+
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi.responses import Response
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models import (
+    SlotFillStatus,
     StartSessionRequest,
     StartSessionResponse,
     SubmitAnswerRequest,
@@ -25,6 +31,7 @@ from app.models import (
     FeedbackResponse,
     FeedbackStats,
     Question,
+    RiskFlag,
     SlotValue,
     SlotStatus,
     AgentState,
@@ -32,15 +39,41 @@ from app.models import (
 )
 from app.services.brain import brain_config
 from app.services.whisper import transcribe_audio
-from app.services.llm import extract_slots, generate_report, generate_clarification_question, generate_followup_question_v2
+from app.services.llm import (
+    extract_slots,
+    generate_report,
+    generate_clarification_question,
+    translate_markdown,
+)
+from app.services.email import send_report_email, extract_report_summary
 from app.services.skill import get_skill_for_prompts
-from app.services.llm_v2 import generate_followup_question_v3
+from app.services.llm_v2 import extract_slots_and_followup
+from app.prompts.templates_v2 import ROLE_LABELS
 from app.services.scoring import select_next_questions, select_next_question_quick
 from app.services.risk import evaluate_risk_rules
 from app.services.quick_policy import evaluate_stop_conditions, calculate_low_info, calculate_quick_progress
 
 router = APIRouter()
 
+_DEFAULT_ROLE_LABELS = ROLE_LABELS["en"]
+
+# msgspec is ~5-10x faster than stdlib json for the large session state blob
+# that is decoded and re-encoded on every answer submission.
+_state_encoder = msgspec.json.Encoder()
+_state_decoder = msgspec.json.Decoder()
+
+
+def _encode_state(state: dict) -> str:
+    """Serialize session state for the jsonb column."""
+    return _state_encoder.encode(state).decode()
+
+
+def _decode_state(raw) -> dict:
+    """Deserialize session state from the jsonb column (asyncpg may return a dict)."""
+    if isinstance(raw, dict):
+        return raw
+    return _state_decoder.decode(raw)
+
 
 def _has_real_value(slot_data: dict) -> bool:
     """Check if slot has a real value (not None, not UNKNOWN)."""
@@ -52,25 +85,63 @@ def _has_real_value(slot_data: dict) -> bool:
     return True
 
 
-def calculate_slot_status(slots: dict, slot_definitions: list) -> list[SlotStatus]:
+_EMPTY_SLOT: dict = {}
+
+
+def _append_agent_question(state: dict, question_id: str, question_text: str, round_no: int) -> None:
+    """Record an agent question in history and keep the O(1) pointer
+    to the latest one, so the clarification branch never has to scan
+    backwards through the full history."""
+    state["history"].append({
+        "role": "agent",
+        "question_id": question_id,
+        "text": question_text,
+        "round": round_no,
+    })
+    state["last_agent_question_text"] = question_text
+    _append_formatted_line(state, "agent", question_text)
+
+
+def _append_formatted_line(state: dict, role: str, text_value: str) -> None:
+    """Append one line to the cached LLM conversation transcript.
+
+    Maintained incrementally as history grows, so precise mode hands
+    the transcript to the follow-up prompt without re-formatting the
+    whole history every turn.
+    """
+    labels = ROLE_LABELS.get(state.get("language", "lt"), _DEFAULT_ROLE_LABELS)
+    state.setdefault("formatted_history", []).append(
+        f"{labels['consultant' if role == 'agent' else 'client']}: {text_value}"
+    )
+
+
+def _to_slot_values(slots: dict) -> dict:
+    """Wrap raw slot dicts as SlotValue objects for scoring and risk
+    evaluation. model_construct: the values are our own state."""
+    return {
+        k: SlotValue.model_construct(value=v["value"], confidence=v["confidence"])
+        for k, v in slots.items()
+    }
+
+
+def calculate_slot_status(slots: dict) -> list[SlotStatus]:
     """Calculate slot status for frontend display."""
     result = []
-    for slot_def in slot_definitions:
-        key = slot_def.get("slot_key")
-        label = slot_def.get("label_lt", key)
-        slot_data = slots.get(key, {})
+    for key, label in brain_config.slot_display_items:
+        slot_data = slots.get(key, _EMPTY_SLOT)
 
         confidence = slot_data.get("confidence", 0.0)
         has_value = _has_real_value(slot_data)
 
         if has_value and confidence >= 0.7:
-            status = "filled"
+            status = SlotFillStatus.FILLED
         elif has_value and confidence >= 0.4:
-            status = "partial"
+            status = SlotFillStatus.PARTIAL
         else:
-            status = "empty"
+            status = SlotFillStatus.EMPTY
 
-        result.append(SlotStatus(
+        # model_construct skips validation; values come from our own state
+        result.append(SlotStatus.model_construct(
             slot_key=key,
             label=label,
             status=status,
@@ -80,19 +151,22 @@ def calculate_slot_status(slots: dict, slot_definitions: list) -> list[SlotStatu
     return result
 
 
-def calculate_progress_percent(slots: dict, slot_definitions: list) -> int:
+def calculate_progress_percent(slots: dict) -> int:
     """
     Calculate overall interview completion percentage.
 
     Required slots (is_required=True) contribute 60% weight.
     Optional slots contribute 40% weight.
     Confidence affects fill level: >0.7 = 100%, 0.4-0.7 = 50%, <0.4 = 0%
+
+    Uses the required/optional partition precomputed on brain_config
+    instead of rebuilding it per call.
     """
-    required_slots = [s for s in slot_definitions if s.get("is_required", False)]
-    optional_slots = [s for s in slot_definitions if not s.get("is_required", False)]
+    required_slots = brain_config.required_slot_keys
+    optional_slots = brain_config.optional_slot_keys
 
     def slot_fill_level(slot_key: str) -> float:
-        slot_data = slots.get(slot_key, {})
+        slot_data = slots.get(slot_key, _EMPTY_SLOT)
         confidence = slot_data.get("confidence", 0.0)
 
         if not _has_real_value(slot_data):
@@ -106,14 +180,14 @@ def calculate_progress_percent(slots: dict, slot_definitions: list) -> int:
 
     # Calculate required slots progress (60% weight)
     if required_slots:
-        required_filled = sum(slot_fill_level(s.get("slot_key")) for s in required_slots)
+        required_filled = sum(slot_fill_level(k) for k in required_slots)
         required_progress = (required_filled / len(required_slots)) * 0.6
     else:
         required_progress = 0.6  # If no required slots, give full credit
 
     # Calculate optional slots progress (40% weight)
     if optional_slots:
-        optional_filled = sum(slot_fill_level(s.get("slot_key")) for s in optional_slots)
+        optional_filled = sum(slot_fill_level(k) for k in optional_slots)
         optional_progress = (optional_filled / len(optional_slots)) * 0.4
     else:
         optional_progress = 0.4  # If no optional slots, give full credit
@@ -137,7 +211,7 @@ async def start_session(
     interview_mode = request.interview_mode if request else "quick"
 
     # Load brain config
-    await brain_config.load_all(db)
+    await brain_config.ensure_fresh(db)
 
     # Initialize empty slots
     initial_slots = {}
@@ -161,23 +235,6 @@ async def start_session(
         "questions_asked_count": 0,  # Track total questions asked in precise mode
     }
 
-    # Insert session into database
-    result = await db.execute(
-        text("""
-            INSERT INTO sessions (language, round, state)
-            VALUES (:language, 1, :state)
-            RETURNING session_id
-        """),
-        {"language": language, "state": json.dumps(initial_state)},
-    )
-    session_id = result.scalar_one()
-
-    # Convert slots dict to SlotValue objects for scoring
-    slots_for_scoring = {
-        k: SlotValue(value=v["value"], confidence=v["confidence"])
-        for k, v in initial_slots.items()
-    }
-
     # Both modes now use 1 question at a time
     question_count = 1
 
@@ -190,6 +247,9 @@ async def start_session(
             "stop_reason": None,
         }
 
+    # Convert slots dict to SlotValue objects for scoring
+    slots_for_scoring = _to_slot_values(initial_slots)
+
     # Select first question(s)
     questions = select_next_questions(
         questions=brain_config.questions,
@@ -203,24 +263,25 @@ async def start_session(
         count=question_count,
     )
 
-    # Update state with selected questions
+    # Record selected questions in state before the write, so the
+    # session is created with a single INSERT instead of INSERT+UPDATE
     initial_state["next_questions"] = [
         {"id": q.id, "text": q.text, "round_hint": q.round_hint}
         for q in questions
     ]
     # Add initial questions to history for expert review
     for q in questions:
-        initial_state["history"].append({
-            "role": "agent",
-            "question_id": q.id,
-            "text": q.text,
-            "round": 1,
-        })
+        _append_agent_question(initial_state, q.id, q.text, 1)
 
-    await db.execute(
-        text("UPDATE sessions SET state = :state WHERE session_id = :id"),
-        {"state": json.dumps(initial_state), "id": session_id},
+    result = await db.execute(
+        text("""
+            INSERT INTO sessions (language, round, state)
+            VALUES (:language, 1, :state)
+            RETURNING session_id
+        """),
+        {"language": language, "state": _encode_state(initial_state)},
     )
+    session_id = result.scalar_one()
 
     return StartSessionResponse(
         session_id=session_id,
@@ -242,10 +303,15 @@ async def transcribe_audio_endpoint(
 
     Returns the transcribed text for user review/editing.
     """
-    # Verify session exists
-    result = await db.execute(
-        text("SELECT language FROM sessions WHERE session_id = :id"),
-        {"id": session_id},
+    # The session-existence lookup and the multipart body read are
+    # independent — overlap the DB round-trip with the network read.
+    # The 404 check still happens before any transcription work.
+    result, audio_data = await asyncio.gather(
+        db.execute(
+            text("SELECT language FROM sessions WHERE session_id = :id"),
+            {"id": session_id},
+        ),
+        audio.read(),
     )
     row = result.fetchone()
     if not row:
@@ -253,9 +319,6 @@ async def transcribe_audio_endpoint(
 
     session_language = language or row[0] or None  # Auto-detect if not specified
 
-    # Read audio data
-    audio_data = await audio.read()
-
     if len(audio_data) == 0:
         raise HTTPException(status_code=400, detail="Empty audio file")
 
@@ -288,7 +351,6 @@ async def submit_answer(
     Extracts slots using LLM, evaluates risks, selects next questions.
     In precise mode, may return clarification question if confidence is low.
     """
-    import time as _time
     _t0 = _time.time()
     def _elapsed(label):
         print(f"[TIMING] {label}: {_time.time() - _t0:.1f}s")
@@ -305,11 +367,11 @@ async def submit_answer(
         raise HTTPException(status_code=404, detail="Session not found")
 
     current_round = row[0]
-    state = row[1] if isinstance(row[1], dict) else json.loads(row[1])
+    state = _decode_state(row[1])
     interview_mode = state.get("interview_mode", "quick")
 
     # Load brain config
-    await brain_config.load_all(db)
+    await brain_config.ensure_fresh(db)
     _elapsed("brain_config_loaded")
 
     # Load skill for enhanced question generation
@@ -328,7 +390,21 @@ async def submit_answer(
         for t in request.transcripts
     ])
 
-    # Update history with user responses
+    if "formatted_history" not in state:
+        # Legacy sessions predate the incremental transcript cache —
+        # rebuild it once from history; appends keep it current
+        role_labels = ROLE_LABELS.get(state.get("language", "lt"), _DEFAULT_ROLE_LABELS)
+        state["formatted_history"] = [
+            f"{role_labels['consultant' if h['role'] == 'agent' else 'client']}: {h['text']}"
+            for h in state["history"]
+            if h["role"] in ("agent", "user")
+        ]
+
+    # Update history with user responses. Membership is checked against
+    # a set — asked_question_ids grows every turn and a list scan per
+    # transcript would be quadratic over a session (state keeps the
+    # list for JSON compatibility).
+    asked_set = set(state["asked_question_ids"])
     for t in request.transcripts:
         state["history"].append({
             "role": "user",
@@ -336,16 +412,31 @@ async def submit_answer(
             "text": t.text,
             "round": current_round,
         })
-        if t.question_id not in state["asked_question_ids"]:
+        _append_formatted_line(state, "user", t.text)
+        if t.question_id not in asked_set:
+            asked_set.add(t.question_id)
             state["asked_question_ids"].append(t.question_id)
 
     # Track questions asked in precise mode
     if interview_mode == "precise":
         state["questions_asked_count"] = state.get("questions_asked_count", 0) + len(request.transcripts)
 
-    # Extract slots using LLM
+    # Extract slots using LLM. Precise mode fuses extraction with the
+    # follow-up question generation into a single LLM call per turn.
     _elapsed("before_extract_slots")
-    extraction_result = await extract_slots(state, combined_answer)
+    ai_followup = None
+    session_language = state.get("language", "lt")
+    if interview_mode == "precise":
+        formatted_history = state["formatted_history"]
+        extraction_result, ai_followup = await extract_slots_and_followup(
+            state,
+            combined_answer,
+            conversation_history=formatted_history,
+            skill_content=skill_content,
+            language=session_language,
+        )
+    else:
+        extraction_result = await extract_slots(state, combined_answer)
     _elapsed("after_extract_slots")
 
     # Update slots
@@ -365,20 +456,33 @@ async def submit_answer(
     state["round_summary"] = extraction_result.round_summary
 
     # Convert slots for risk evaluation
-    slots_for_eval = {
-        k: SlotValue(value=v["value"], confidence=v["confidence"])
-        for k, v in state["slots"].items()
-    }
+    slots_for_eval = _to_slot_values(state["slots"])
 
-    # Evaluate risk rules
-    risk_flags = evaluate_risk_rules(slots_for_eval, brain_config.risk_rules)
-    state["risk_flags"] = [rf.model_dump() for rf in risk_flags]
+    if slots_updated or "progress_percent_cache" not in state:
+        # Evaluate risk rules
+        risk_flags = evaluate_risk_rules(slots_for_eval, brain_config.risk_rules)
+        state["risk_flags"] = [rf.model_dump() for rf in risk_flags]
 
-    # Calculate slot status for frontend
-    slot_status = calculate_slot_status(state["slots"], brain_config.slots)
+        # Calculate slot status for frontend
+        slot_status = calculate_slot_status(state["slots"])
 
-    # Calculate progress percentage
-    progress_percent = calculate_progress_percent(state["slots"], brain_config.slots)
+        # Calculate progress percentage
+        progress_percent = calculate_progress_percent(state["slots"])
+        state["progress_percent_cache"] = progress_percent
+    else:
+        # Low-info turn: no slot changed, so the previous risk flags,
+        # slot status and progress are still valid — skip the sweeps
+        risk_flags = [
+            RiskFlag.model_construct(
+                code=rf["code"],
+                severity=rf.get("severity", "medium"),
+                note=rf.get("note"),
+                evidence=tuple(rf.get("evidence", ())),
+            )
+            for rf in state["risk_flags"]
+        ]
+        slot_status = calculate_slot_status(state["slots"])
+        progress_percent = state["progress_percent_cache"]
 
     # Check if clarification is needed (precise mode only)
     clarification_question = None
@@ -397,15 +501,19 @@ async def submit_answer(
             low_confidence_slots.sort(key=lambda x: x[1]["confidence"])
             slot_key, slot_data = low_confidence_slots[0]
 
-            # Find the original question from history
-            original_question = ""
-            user_answer = ""
-            for h in reversed(state["history"]):
-                if h["role"] == "agent":
-                    original_question = h["text"]
-                    break
-                elif h["role"] == "user":
-                    user_answer = h["text"]
+            # The latest agent question is tracked as an O(1) pointer;
+            # legacy sessions that predate it fall back to scanning
+            original_question = state.get("last_agent_question_text")
+            user_answer = request.transcripts[0].text if request.transcripts else ""
+            if original_question is None:
+                original_question = ""
+                user_answer = ""
+                for h in reversed(state["history"]):
+                    if h["role"] == "agent":
+                        original_question = h["text"]
+                        break
+                    elif h["role"] == "user":
+                        user_answer = h["text"]
 
             clarification_question = await generate_clarification_question(
                 slot_key=slot_key,
@@ -443,46 +551,9 @@ async def submit_answer(
             next_questions = []
             state["next_questions"] = []
         else:
-            # First, try AI-generated follow-up question (hybrid approach)
-            ai_followup = None
-
-            # Get session language for multilingual support
-            session_language = state.get("language", "lt")
-
-            # Language-specific role labels
-            role_labels = {
-                "lt": {"consultant": "Konsultantas", "client": "Klientas"},
-                "en": {"consultant": "Consultant", "client": "Client"},
-                "ru": {"consultant": "Консультант", "client": "Клиент"},
-            }.get(session_language, {"consultant": "Consultant", "client": "Client"})
-
-            # Format full conversation history for AI context
-            formatted_history = []
-            for h in state["history"]:
-                if h["role"] == "agent":
-                    formatted_history.append(f"{role_labels['consultant']}: {h['text']}")
-                elif h["role"] == "user":
-                    formatted_history.append(f"{role_labels['client']}: {h['text']}")
-
-            # Try AI generation with full context
-            if formatted_history:
-                # Try skill-enhanced AI generation (v3) if skill is loaded
-                if skill_content:
-                    ai_followup = await generate_followup_question_v3(
-                        conversation_history=formatted_history,
-                        collected_slots=state["slots"],
-                        missing_slots=state.get("unknown_slots", []),
-                        skill_content=skill_content,
-                        language=session_language,
-                    )
-                else:
-                    ai_followup = await generate_followup_question_v2(
-                        conversation_history=formatted_history,
-                        collected_slots=state["slots"],
-                        missing_slots=state.get("unknown_slots", []),
-                    )
-                _elapsed("after_followup_gen")
-
+            # The AI follow-up question was produced by the combined
+            # extraction call above; fall back to predefined selection
+            # below when it is empty
             if ai_followup:
                 # Use AI-generated question
                 ai_question_id = f"AI_FOLLOWUP_{questions_asked}"
@@ -491,12 +562,7 @@ async def submit_answer(
                     {"id": ai_question_id, "text": ai_followup, "round_hint": None}
                 ]
                 # Add agent question to history for expert review
-                state["history"].append({
-                    "role": "agent",
-                    "question_id": ai_question_id,
-                    "text": ai_followup,
-                    "round": current_round,
-                })
+                _append_agent_question(state, ai_question_id, ai_followup, current_round)
             else:
                 # Fall back to predefined question selection
                 next_questions = select_next_questions(
@@ -521,16 +587,9 @@ async def submit_answer(
                 ]
                 # Add agent questions to history for expert review
                 for q in next_questions:
-                    state["history"].append({
-                        "role": "agent",
-                        "question_id": q.id,
-                        "text": q.text,
-                        "round": current_round,
-                    })
+                    _append_agent_question(state, q.id, q.text, current_round)
     else:
         # Quick mode: Iterative top-1 loop with stop conditions
-        import copy as _copy
-
         # Track questions asked
         state["questions_asked_count"] = state.get("questions_asked_count", 0) + len(request.transcripts)
 
@@ -597,12 +656,7 @@ async def submit_answer(
                         {"id": next_q.id, "text": next_q.text, "round_hint": next_q.round_hint}
                     ]
                     # Add to history for expert review
-                    state["history"].append({
-                        "role": "agent",
-                        "question_id": next_q.id,
-                        "text": next_q.text,
-                        "round": 1,
-                    })
+                    _append_agent_question(state, next_q.id, next_q.text, 1)
                     is_complete = False
                 else:
                     # No more questions available
@@ -635,12 +689,7 @@ async def submit_answer(
                         for q in next_questions
                     ]
                     for q in next_questions:
-                        state["history"].append({
-                            "role": "agent",
-                            "question_id": q.id,
-                            "text": q.text,
-                            "round": 1,
-                        })
+                        _append_agent_question(state, q.id, q.text, 1)
                     is_complete = False
                 else:
                     is_complete = True
@@ -658,7 +707,7 @@ async def submit_answer(
         """),
         {
             "round": state.get("round", current_round),
-            "state": json.dumps(state),
+            "state": _encode_state(state),
             "id": session_id,
         },
     )
@@ -692,9 +741,6 @@ async def finalize_session(
     - Extracts summary (Sections I-III) for client display
     - Sends full report via email if email provided
     """
-    from app.services.email import send_report_email, extract_report_summary
-    from datetime import datetime
-
     # Load session
     result = await db.execute(
         text("SELECT state, language FROM sessions WHERE session_id = :id"),
@@ -704,7 +750,7 @@ async def finalize_session(
     if not row:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    state = row[0] if isinstance(row[0], dict) else json.loads(row[0])
+    state = _decode_state(row[0])
     language = row[1] or "lt"
 
     # Extract contact info
@@ -720,7 +766,7 @@ async def finalize_session(
         contact_phone = contact_info.get("phone")
 
     # Load brain config for report footer
-    await brain_config.load_all(db)
+    await brain_config.ensure_fresh(db)
     report_footer = brain_config.get_config_value("report_footer", "")
 
     # Load skill for enhanced report generation
@@ -743,19 +789,26 @@ async def finalize_session(
     # Extract summary (Sections I-III) for client display
     report_summary = extract_report_summary(final_markdown)
 
-    # Send email if email provided
-    email_sent_at = None
-    if contact_email:
+    async def _translate_and_send_email():
+        """Translate the report if needed and email it.
+
+        Returns the send timestamp, or None when no email was sent.
+        Runs concurrently with the final state UPDATE below — it only
+        touches the LLM and SMTP, never the request's DB session.
+        """
+        if not contact_email:
+            return None
         try:
             # Translate report if not Lithuanian
             email_report = final_markdown
             if language and language != "lt":
-                from app.services.llm import translate_markdown
                 print(f"Translating report to {language} for email...")
                 email_report = await translate_markdown(final_markdown, language)
                 print(f"Report translated to {language}")
 
-            success = send_report_email(
+            # SMTP send is blocking — keep it off the event loop
+            success = await asyncio.to_thread(
+                send_report_email,
                 to_email=contact_email,
                 to_name=contact_name or "Client",
                 report_markdown=email_report,
@@ -763,16 +816,49 @@ async def finalize_session(
                 language=language,
             )
             if success:
-                email_sent_at = datetime.now()
                 print(f"Email sent to {contact_email} for session {session_id}")
+                return datetime.now()
         except Exception as e:
             print(f"Failed to send email: {e}")
+        return None
+
+    # Save the (untranslated) report and final state while the
+    # translation + email pipeline runs; user-visible latency becomes
+    # max(db write, translate+send) instead of their sum
+    email_sent_at, _ = await asyncio.gather(
+        _translate_and_send_email(),
+        db.execute(
+            text("""
+                UPDATE sessions
+                SET final_report = :report,
+                    report_summary = :summary,
+                    state = :state,
+                    contact_name = :contact_name,
+                    contact_email = :contact_email,
+                    contact_phone = :contact_phone,
+                    completed_at = NOW(),
+                    updated_at = NOW()
+                WHERE session_id = :id
+            """),
+            {
+                "report": final_markdown,
+                "summary": report_summary,
+                "state": _encode_state(state),
+                "contact_name": contact_name,
+                "contact_email": contact_email,
+                "contact_phone": contact_phone,
+                "id": session_id,
+            },
+        ),
+    )
+    if email_sent_at is not None:
+        await db.execute(
+            text("UPDATE sessions SET email_sent_at = :email_sent_at WHERE session_id = :id"),
+            {"email_sent_at": email_sent_at, "id": session_id},
+        )
 
     # Convert slots to SlotValue objects
-    slots = {
-        k: SlotValue(value=v["value"], confidence=v["confidence"])
-        for k, v in state.get("slots", {}).items()
-    }
+    slots = _to_slot_values(state.get("slots", {}))
 
     # Convert risk flags
     risk_flags = [
@@ -780,33 +866,6 @@ async def finalize_session(
         for rf in state.get("risk_flags", [])
     ]
 
-    # Save to database with all new fields
-    await db.execute(
-        text("""
-            UPDATE sessions
-            SET final_report = :report,
-                report_summary = :summary,
-                state = :state,
-                contact_name = :contact_name,
-                contact_email = :contact_email,
-                contact_phone = :contact_phone,
-                email_sent_at = :email_sent_at,
-                completed_at = NOW(),
-                updated_at = NOW()
-            WHERE session_id = :id
-        """),
-        {
-            "report": final_markdown,
-            "summary": report_summary,
-            "state": json.dumps(state),
-            "contact_name": contact_name,
-            "contact_email": contact_email,
-            "contact_phone": contact_phone,
-            "email_sent_at": email_sent_at,
-            "id": session_id,
-        },
-    )
-
     # Return summary to client (not full report)
     # Full report was sent to email and is visible in admin
     return FinalizeResponse(
@@ -828,31 +887,17 @@ async def submit_feedback(
     """
     Submit user feedback for a completed session.
     """
-    # Verify session exists and is completed
+    # Guarded insert: the SELECT only produces a row for a completed
+    # session, and ON CONFLICT swallows duplicates (unique index from
+    # migration 010), so the happy path is a single round-trip
     result = await db.execute(
-        text("SELECT completed_at FROM sessions WHERE session_id = :id"),
-        {"id": session_id},
-    )
-    row = result.fetchone()
-    if not row:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    if not row[0]:
-        raise HTTPException(status_code=400, detail="Session not yet completed")
-
-    # Check if feedback already exists
-    existing = await db.execute(
-        text("SELECT id FROM feedback WHERE session_id = :id"),
-        {"id": session_id},
-    )
-    if existing.fetchone():
-        raise HTTPException(status_code=400, detail="Feedback already submitted")
-
-    # Insert feedback
-    await db.execute(
         text("""
             INSERT INTO feedback (session_id, rating, feedback_text)
-            VALUES (:session_id, :rating, :text)
+            SELECT session_id, :rating, :text
+            FROM sessions
+            WHERE session_id = :session_id AND completed_at IS NOT NULL
+            ON CONFLICT (session_id) DO NOTHING
+            RETURNING id
         """),
         {
             "session_id": session_id,
@@ -860,6 +905,18 @@ async def submit_feedback(
             "text": request.feedback_text,
         },
     )
+    if result.scalar_one_or_none() is None:
+        # Error path only: one extra query to pick the right detail
+        check = await db.execute(
+            text("SELECT completed_at FROM sessions WHERE session_id = :id"),
+            {"id": session_id},
+        )
+        row = check.fetchone()
+        if not row:
+            raise HTTPException(status_code=404, detail="Session not found")
+        if not row[0]:
+            raise HTTPException(status_code=400, detail="Session not yet completed")
+        raise HTTPException(status_code=400, detail="Feedback already submitted")
 
     return {"success": True, "message": "Feedback submitted successfully"}
 
@@ -880,12 +937,12 @@ async def get_session_state(
     if not row:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    state = row[1] if isinstance(row[1], dict) else json.loads(row[1])
+    state = _decode_state(row[1])
 
     # Load brain config to calculate slot status and progress
-    await brain_config.load_all(db)
-    slot_status = calculate_slot_status(state.get("slots", {}), brain_config.slots)
-    progress_percent = calculate_progress_percent(state.get("slots", {}), brain_config.slots)
+    await brain_config.ensure_fresh(db)
+    slot_status = calculate_slot_status(state.get("slots", {}))
+    progress_percent = calculate_progress_percent(state.get("slots", {}))
 
     return {
         "session_id": str(session_id),
@@ -925,7 +982,7 @@ async def get_session_results(
     if not row[3]:  # completed_at
         raise HTTPException(status_code=400, detail="Session not yet completed")
 
-    state = row[0] if isinstance(row[0], dict) else json.loads(row[0])
+    state = _decode_state(row[0])
 
     # Use summary if available, otherwise fall back to full report
     display_markdown = row[2] if row[2] else row[1]
@@ -951,8 +1008,6 @@ async def download_report(
     """
     Download the final report as a Markdown file.
     """
-    from fastapi.responses import Response
-
     result = await db.execute(
         text("SELECT final_report, completed_at FROM sessions WHERE session_id = :id"),
         {"id": session_id},
@@ -982,8 +1037,6 @@ async def translate_report(
     """
     Translate the final report to target language.
     """
-    from app.services.llm import translate_markdown
-
     result = await db.execute(
         text("SELECT final_report, state FROM sessions WHERE session_id = :id"),
         {"id": session_id},
@@ -4,7 +4,9 @@ Brain Configuration Loader Service
 Loads and caches brain configuration from the database.
 """
 
+import asyncio
 import json
+import time
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy import text
@@ -12,6 +14,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 import yaml
 
+# How long a loaded config is trusted before ensure_fresh re-reads it.
+# Keeps multiple workers eventually consistent after a /brain/config
+# import without paying the reload queries on every request.
+_REFRESH_TTL_SECONDS = 30.0
+
 
 class BrainConfigLoader:
     def __init__(self):
@@ -22,6 +29,28 @@ class BrainConfigLoader:
         self._scoring_weights: Optional[Dict[str, float]] = None
         self._config_values: Dict[str, Any] = {}
         self._quick_policy = None  # Cached QuickPolicy instance
+        self._slots_by_key: Dict[str, Dict[str, Any]] = {}
+        self._slot_display_items: List[tuple] = []  # (slot_key, label_lt) pairs
+        self._required_slot_keys: tuple = ()
+        self._optional_slot_keys: tuple = ()
+        self._version = 0  # Bumped on invalidation; lets callers cache derived data
+        self._loaded_at = 0.0  # monotonic time of last successful load
+        self._refresh_lock = asyncio.Lock()
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        """Load the config if missing or older than the refresh TTL.
+
+        Hot endpoints call this instead of load_all so that a warm
+        process serves from memory; the lock collapses a thundering
+        herd of expired callers into a single reload.
+        """
+        now = time.monotonic()
+        if self._slots is not None and now - self._loaded_at < _REFRESH_TTL_SECONDS:
+            return
+        async with self._refresh_lock:
+            if self._slots is not None and time.monotonic() - self._loaded_at < _REFRESH_TTL_SECONDS:
+                return
+            await self.load_all(db, force_reload=self._slots is not None)
 
     async def load_all(self, db: AsyncSession, force_reload: bool = False) -> None:
         if force_reload or self._slots is None:
@@ -38,6 +67,27 @@ class BrainConfigLoader:
             self._config_values = await self._load_config_values(db)
         if force_reload or self._quick_policy is None:
             self._quick_policy = self._build_quick_policy()
+        self._rebuild_slot_indexes()
+        self._loaded_at = time.monotonic()
+
+    def _rebuild_slot_indexes(self) -> None:
+        """Derive per-slot lookups so hot helpers avoid re-scanning.
+
+        The slot list is static between reloads; progress and status
+        calculations run every answer turn and only need keys, labels
+        and the required/optional partition.
+        """
+        slots = self._slots or []
+        self._slots_by_key = {s["slot_key"]: s for s in slots}
+        self._slot_display_items = [
+            (s["slot_key"], s.get("label_lt") or s["slot_key"]) for s in slots
+        ]
+        self._required_slot_keys = tuple(
+            s["slot_key"] for s in slots if s.get("is_required", False)
+        )
+        self._optional_slot_keys = tuple(
+            s["slot_key"] for s in slots if not s.get("is_required", False)
+        )
 
     async def _load_slots(self, db: AsyncSession) -> List[Dict[str, Any]]:
         result = await db.execute(text("""
@@ -144,7 +194,33 @@ class BrainConfigLoader:
     def scoring_weights(self) -> Dict[str, float]:
         return self._scoring_weights or {}
 
+    @property
+    def slots_by_key(self) -> Dict[str, Dict[str, Any]]:
+        return self._slots_by_key
+
+    @property
+    def slot_display_items(self) -> List[tuple]:
+        return self._slot_display_items
+
+    @property
+    def required_slot_keys(self) -> tuple:
+        return self._required_slot_keys
+
+    @property
+    def optional_slot_keys(self) -> tuple:
+        return self._optional_slot_keys
+
+    @property
+    def cache_version(self) -> int:
+        """Monotonic counter bumped on invalidation.
+
+        Callers that derive lookups from the config (e.g. question text
+        maps) can compare this instead of rebuilding per request.
+        """
+        return self._version
+
     def invalidate_cache(self) -> None:
+        self._version += 1
         self._slots = None
         self._questions = None
         self._risk_rules = None
@@ -152,6 +228,10 @@ class BrainConfigLoader:
         self._scoring_weights = None
         self._config_values = {}
         self._quick_policy = None
+        self._slots_by_key = {}
+        self._slot_display_items = []
+        self._required_slot_keys = ()
+        self._optional_slot_keys = ()
 
     async def export_to_yaml(self, db: AsyncSession) -> str:
         await self.load_all(db, force_reload=True)
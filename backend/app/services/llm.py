@@ -4,8 +4,10 @@ LLM Service - Gemini + Anthropic Fallback with Translation
 Tries Gemini first, falls back to Anthropic on quota errors.
 """
 
+import hashlib
 import json
 import re
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 
 from google import genai
@@ -14,13 +16,14 @@ from anthropic import Anthropic
 from app.config import get_settings
 from app.models import LLMExtractionResponse, SlotValue
 from app.prompts.templates import (
-    SYSTEM_PROMPT,
+    SYSTEM_PROMPT_PREFIX,
     format_extraction_prompt,
     format_report_prompt,
     format_clarification_prompt,
+    format_followup_prompt_v2,
 )
 from app.prompts.templates_v2 import (
-    SYSTEM_PROMPT_V2,
+    SYSTEM_PROMPT_V2_PREFIX,
     format_report_prompt_v2,
 )
 
@@ -122,9 +125,30 @@ def _call_llm_with_fallback(prompt: str) -> str:
             raise e
 
 
+# Exact-match response cache for prompts that repeat across sessions
+# (short-text translations, clarification questions). Keyed by a 16-byte
+# blake2b digest so large prompts are not held as dict keys.
+_response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_RESPONSE_CACHE_MAX = 1024
+
+
+def _call_llm_cached(prompt: str) -> str:
+    """Like _call_llm_with_fallback, but memoized on the exact prompt."""
+    key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+    cached = _response_cache.get(key)
+    if cached is not None:
+        _response_cache.move_to_end(key)
+        return cached
+    result = _call_llm_with_fallback(prompt)
+    _response_cache[key] = result
+    if len(_response_cache) > _RESPONSE_CACHE_MAX:
+        _response_cache.popitem(last=False)
+    return result
+
+
 async def extract_slots(agent_state, user_answer):
     prompt = format_extraction_prompt(agent_state, user_answer)
-    full_prompt = f"{SYSTEM_PROMPT}\n\n{prompt}"
+    full_prompt = SYSTEM_PROMPT_PREFIX + prompt
 
     try:
         response_text = _call_llm_with_fallback(full_prompt)
@@ -176,10 +200,10 @@ async def generate_report(
     # Use enhanced prompt if skill is available
     if skill_content:
         prompt = format_report_prompt_v2(agent_state, contact_info, report_footer, skill_content)
-        full_prompt = f"{SYSTEM_PROMPT_V2}\n\n{prompt}"
+        full_prompt = SYSTEM_PROMPT_V2_PREFIX + prompt
     else:
         prompt = format_report_prompt(agent_state, contact_info, report_footer)
-        full_prompt = f"{SYSTEM_PROMPT}\n\n{prompt}"
+        full_prompt = SYSTEM_PROMPT_PREFIX + prompt
 
     try:
         raw_text = _call_llm_with_fallback(full_prompt)
@@ -224,10 +248,10 @@ async def generate_clarification_question(
         original_question=original_question,
         user_answer=user_answer,
     )
-    full_prompt = f"{SYSTEM_PROMPT}\n\n{prompt}"
+    full_prompt = SYSTEM_PROMPT_PREFIX + prompt
 
     try:
-        response_text = _call_llm_with_fallback(full_prompt)
+        response_text = _call_llm_cached(full_prompt)
         response_text = _extract_json(response_text)
         data = json.loads(response_text)
 
@@ -281,7 +305,7 @@ Text to translate:
 {text}"""
 
     try:
-        result = _call_llm_with_fallback(prompt)
+        result = _call_llm_cached(prompt)
         return result.strip()
     except Exception as e:
         print(f"Text translation error: {e}")
@@ -303,8 +327,6 @@ async def generate_followup_question_v2(
     Returns:
         Follow-up question string, or None on failure
     """
-    from app.prompts.templates import format_followup_prompt_v2
-
     print(f"AI followup context: {len(conversation_history)} history items, {len(missing_slots)} missing slots")
 
     prompt = format_followup_prompt_v2(
@@ -312,7 +334,7 @@ async def generate_followup_question_v2(
         collected_slots=collected_slots,
         missing_slots=missing_slots,
     )
-    full_prompt = SYSTEM_PROMPT + "\n\n" + prompt
+    full_prompt = SYSTEM_PROMPT_PREFIX + prompt
 
     try:
         response_text = _call_llm_with_fallback(full_prompt)
@@ -1,128 +1,30 @@
 """
 LLM Service v2 - Enhanced with Pirtis Design Skill Integration
 
-Tries Gemini first, falls back to Anthropic on quota errors.
-Injects skill methodology into prompts for better question generation.
+Skill-aware variants of the LLM calls. The Gemini/Anthropic clients,
+fallback logic and response parsing live in app.services.llm — this
+module only adds the prompts that inject skill methodology.
 """
 
 import json
-import re
-from typing import Dict, Any, Optional
+from typing import Optional
 
-from google import genai
-from anthropic import Anthropic
-
-from app.config import get_settings
 from app.models import LLMExtractionResponse, SlotValue
 from app.prompts.templates import (
-    SYSTEM_PROMPT,
+    SYSTEM_PROMPT_PREFIX,
     format_extraction_prompt,
-    format_report_prompt,
     format_clarification_prompt,
 )
 from app.prompts.templates_v2 import (
-    SYSTEM_PROMPT_V2,
+    SYSTEM_PROMPT_V2_PREFIX,
+    format_combined_prompt_v3,
     format_extraction_prompt_v2,
     format_followup_prompt_v3,
-    format_report_prompt_v2,
 )
-
-_gemini_client = None
-_anthropic_client = None
-
-
-def _get_gemini_client():
-    global _gemini_client
-    if _gemini_client is None:
-        settings = get_settings()
-        _gemini_client = genai.Client(api_key=settings.google_api_key)
-    return _gemini_client
-
-
-def _get_anthropic_client():
-    global _anthropic_client
-    if _anthropic_client is None:
-        settings = get_settings()
-        _anthropic_client = Anthropic(api_key=settings.anthropic_api_key)
-    return _anthropic_client
-
-
-def _extract_json(text):
-    text = text.strip()
-    json_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
-    if json_match:
-        return json_match.group(1).strip()
-    if text.startswith("{") or text.startswith("["):
-        return text
-    return text
-
-
-def _extract_markdown_from_response(raw_text):
-    """Extract markdown from LLM response."""
-    try:
-        json_text = _extract_json(raw_text)
-        data = json.loads(json_text)
-        md = data.get("final_markdown", "")
-        if "\n" in md:
-            md = md.replace("\n", "\n")
-        return md
-    except json.JSONDecodeError:
-        pass
-
-    match = re.search(r'"final_markdown"\s*:\s*"(.*)"', raw_text, re.DOTALL)
-    if match:
-        md = match.group(1)
-        md = md.replace("\n", "\n").replace('\\"', '"').replace("\\\\", "\\")
-        return md.strip()
-
-    if raw_text.strip().startswith("#"):
-        return raw_text.strip()
-
-    return ""
-
-
-def _call_gemini(prompt: str) -> str:
-    """Call Gemini API."""
-    client = _get_gemini_client()
-    response = client.models.generate_content(
-        model="gemini-2.0-flash",
-        contents=prompt,
-    )
-    return response.text
-
-
-def _call_anthropic(prompt: str) -> str:
-    """Call Anthropic API."""
-    client = _get_anthropic_client()
-    response = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=4096,
-        messages=[{"role": "user", "content": prompt}],
-    )
-    return response.content[0].text
-
-
-def _call_llm_with_fallback(prompt: str) -> str:
-    """Try Gemini first, fall back to Anthropic on quota errors."""
-    try:
-        print("Trying Gemini...")
-        result = _call_gemini(prompt)
-        print("Gemini succeeded")
-        return result
-    except Exception as e:
-        error_str = str(e)
-        if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str or "quota" in error_str.lower():
-            print(f"Gemini quota exceeded, falling back to Anthropic: {error_str[:100]}")
-            try:
-                result = _call_anthropic(prompt)
-                print("Anthropic succeeded")
-                return result
-            except Exception as e2:
-                print(f"Anthropic also failed: {e2}")
-                raise e2
-        else:
-            print(f"Gemini error (not quota): {e}")
-            raise e
+from app.services.llm import (
+    _call_llm_with_fallback,
+    _extract_json,
+)
 
 
 async def extract_slots(agent_state, user_answer, use_skill: bool = True):
@@ -136,10 +38,10 @@ async def extract_slots(agent_state, user_answer, use_skill: bool = True):
     """
     if use_skill:
         prompt = format_extraction_prompt_v2(agent_state, user_answer)
-        full_prompt = f"{SYSTEM_PROMPT_V2}\n\n{prompt}"
+        full_prompt = SYSTEM_PROMPT_V2_PREFIX + prompt
     else:
         prompt = format_extraction_prompt(agent_state, user_answer)
-        full_prompt = f"{SYSTEM_PROMPT}\n\n{prompt}"
+        full_prompt = SYSTEM_PROMPT_PREFIX + prompt
 
     try:
         response_text = _call_llm_with_fallback(full_prompt)
@@ -170,45 +72,65 @@ async def extract_slots(agent_state, user_answer, use_skill: bool = True):
         )
 
 
-async def generate_report(
-    agent_state: dict,
-    contact_info: Optional[dict] = None,
-    report_footer: Optional[str] = None,
-    skill_content: Optional[dict] = None,
-) -> str:
+async def extract_slots_and_followup(
+    agent_state,
+    user_answer,
+    conversation_history: list,
+    skill_content: dict = None,
+    language: str = "lt",
+):
     """
-    Generate final report using LLM with skill template.
+    Extract slots AND generate the next follow-up question in one LLM call.
 
-    Args:
-        agent_state: Current session state
-        contact_info: Optional contact info dict with name, email, phone
-        report_footer: Optional footer text from admin config
-        skill_content: Optional skill content for template injection
+    Precise mode previously made two sequential calls per turn (extraction,
+    then follow-up generation); fusing them halves the per-turn LLM latency
+    and sends agent_state only once.
 
     Returns:
-        Markdown report string
+        (LLMExtractionResponse, followup_question or None). The follow-up
+        is None if the model did not produce one; callers fall back to
+        predefined question selection.
     """
-    if skill_content:
-        prompt = format_report_prompt_v2(agent_state, contact_info, report_footer, skill_content)
-        full_prompt = f"{SYSTEM_PROMPT_V2}\n\n{prompt}"
-    else:
-        prompt = format_report_prompt(agent_state, contact_info, report_footer)
-        full_prompt = f"{SYSTEM_PROMPT}\n\n{prompt}"
+    prompt = format_combined_prompt_v3(
+        agent_state=agent_state,
+        user_answer=user_answer,
+        conversation_history=conversation_history,
+        skill_content=skill_content,
+        language=language,
+    )
+    full_prompt = SYSTEM_PROMPT_V2_PREFIX + prompt
 
     try:
-        raw_text = _call_llm_with_fallback(full_prompt)
-        markdown = _extract_markdown_from_response(raw_text)
+        response_text = _call_llm_with_fallback(full_prompt)
+        response_text = _extract_json(response_text)
+        data = json.loads(response_text)
 
-        if markdown:
-            print(f"Report OK, length: {len(markdown)}")
-            return markdown
-        else:
-            print("Failed to extract markdown")
-            return "# Report Error\n\nCould not extract report."
+        updated_slots = {}
+        for key, value in data.get("updated_slots", {}).items():
+            if isinstance(value, dict):
+                updated_slots[key] = SlotValue(
+                    value=value.get("value"),
+                    confidence=value.get("confidence", 0.0),
+                )
 
+        extraction = LLMExtractionResponse(
+            updated_slots=updated_slots,
+            round_summary=data.get("round_summary", ""),
+            unknown_slots=data.get("unknown_slots", []),
+            notes_for_backend=data.get("notes_for_backend", []),
+        )
+        return extraction, data.get("followup_question") or None
     except Exception as e:
-        print(f"Report error: {e}")
-        return f"# Report Error\n\n{str(e)}"
+        print(f"Combined extract+followup error: {e}")
+        return (
+            LLMExtractionResponse(
+                updated_slots={},
+                round_summary=f"Error: {str(e)[:100]}",
+                unknown_slots=[],
+                notes_for_backend=[str(e)],
+            ),
+            None,
+        )
 
 
 async def generate_clarification_question(
@@ -221,6 +143,8 @@ async def generate_clarification_question(
     """
     Generate a clarification question for a low-confidence slot.
 
+    Same as the v1 variant but with the skill-enhanced system prompt.
+
     Args:
         slot_key: The slot that needs clarification
         current_value: Current extracted value
@@ -238,7 +162,7 @@ async def generate_clarification_question(
         original_question=original_question,
         user_answer=user_answer,
     )
-    full_prompt = f"{SYSTEM_PROMPT_V2}\n\n{prompt}"
+    full_prompt = SYSTEM_PROMPT_V2_PREFIX + prompt
 
     try:
         response_text = _call_llm_with_fallback(full_prompt)
@@ -251,102 +175,6 @@ async def generate_clarification_question(
         return None
 
 
-async def translate_markdown(markdown: str, target_language: str) -> str:
-    """Translate markdown report to target language."""
-
-    lang_names = {
-        'en': 'English',
-        'ru': 'Russian',
-        'lt': 'Lithuanian',
-    }
-    lang_name = lang_names.get(target_language, target_language)
-
-    prompt = f"""Translate the following markdown document to {lang_name}.
-Keep all markdown formatting (headers, tables, lists, bold, etc.) intact.
-Only translate the text content, not the markdown syntax.
-
-Document to translate:
-{markdown}
-
-Return ONLY the translated markdown, nothing else."""
-
-    try:
-        result = _call_llm_with_fallback(prompt)
-        return result.strip()
-    except Exception as e:
-        print(f"Translation error: {e}")
-        return f"# Translation Error\n\n{str(e)}"
-
-
-async def translate_text(text: str, target_language: str) -> str:
-    """Translate short text (question, summary) to target language."""
-
-    lang_names = {
-        'en': 'English',
-        'ru': 'Russian',
-        'lt': 'Lithuanian',
-    }
-    lang_name = lang_names.get(target_language, target_language)
-
-    prompt = f"""Translate the following text to {lang_name}.
-Keep the same tone and style. Return ONLY the translated text, nothing else.
-
-Text to translate:
-{text}"""
-
-    try:
-        result = _call_llm_with_fallback(prompt)
-        return result.strip()
-    except Exception as e:
-        print(f"Text translation error: {e}")
-        return text  # Return original on failure
-
-
-async def generate_followup_question_v2(
-    conversation_history: list,
-    collected_slots: dict,
-    missing_slots: list,
-) -> str:
-    """
-    Generate contextual follow-up question using AI with full conversation context.
-    Uses old prompt format (without skill integration).
-
-    Args:
-        conversation_history: List of formatted conversation entries
-        collected_slots: Dict of collected slot data with values and confidence
-        missing_slots: List of slot keys still needing data
-
-    Returns:
-        Follow-up question string, or None on failure
-    """
-    from app.prompts.templates import format_followup_prompt_v2
-
-    print(f"AI followup context: {len(conversation_history)} history items, {len(missing_slots)} missing slots")
-
-    prompt = format_followup_prompt_v2(
-        conversation_history=conversation_history,
-        collected_slots=collected_slots,
-        missing_slots=missing_slots,
-    )
-    full_prompt = SYSTEM_PROMPT + "\n\n" + prompt
-
-    try:
-        response_text = _call_llm_with_fallback(full_prompt)
-        response_text = _extract_json(response_text)
-        data = json.loads(response_text)
-
-        followup = data.get("followup_question")
-        if followup:
-            print(f"AI generated followup: {followup[:80]}...")
-            return followup
-
-        print("No followup_question in AI response")
-        return None
-    except Exception as e:
-        print(f"Followup generation error: {e}")
-        return None
-
-
 async def generate_followup_question_v3(
     conversation_history: list,
     collected_slots: dict,
@@ -379,7 +207,7 @@ async def generate_followup_question_v3(
         skill_content=skill_content,
         language=language,
     )
-    full_prompt = SYSTEM_PROMPT_V2 + "\n\n" + prompt
+    full_prompt = SYSTEM_PROMPT_V2_PREFIX + prompt
 
     try:
         response_text = _call_llm_with_fallback(full_prompt)
@@ -0,0 +1,9 @@
+-- Migration: Composite covering index for admin feedback listing
+-- Version: 2026-08-29
+-- list_feedback filters on rating and orders by created_at DESC; the
+-- composite index serves filter + sort together, and INCLUDE makes the
+-- listing query index-only (no heap fetch).
+
+CREATE INDEX IF NOT EXISTS idx_feedback_created_rating
+    ON feedback (created_at DESC, id DESC, rating)
+    INCLUDE (session_id, feedback_text);
@@ -0,0 +1,8 @@
+-- Migration: BRIN index on feedback.created_at
+-- Version: 2026-08-29
+-- feedback is append-only, so created_at correlates with physical row
+-- order; a BRIN index is orders of magnitude smaller than a btree and
+-- lets windowed stats queries skip old pages.
+
+CREATE INDEX IF NOT EXISTS idx_feedback_created_brin
+    ON feedback USING BRIN (created_at);
@@ -0,0 +1,7 @@
+-- Migration: Composite index for the expert-review session list
+-- Version: 2026-08-29
+-- Matches ORDER BY s.created_at DESC, s.session_id DESC and the keyset
+-- cursor predicate, so each page is returned pre-sorted in O(limit).
+
+CREATE INDEX IF NOT EXISTS idx_sessions_created_id_desc
+    ON sessions (created_at DESC, session_id DESC);
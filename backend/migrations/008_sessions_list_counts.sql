@@ -0,0 +1,28 @@
+-- Migration: Precomputed list-view counters on sessions
+-- Version: 2026-08-29
+-- The session list recomputed questions_count / slots_filled from the
+-- state jsonb per row on every page. Maintain them on write with a
+-- trigger so list reads become plain column fetches.
+
+ALTER TABLE sessions ADD COLUMN IF NOT EXISTS questions_count INT NOT NULL DEFAULT 0;
+ALTER TABLE sessions ADD COLUMN IF NOT EXISTS slots_filled_count INT NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION sessions_update_list_counts() RETURNS trigger AS $$
+BEGIN
+    NEW.questions_count := COALESCE(jsonb_array_length(NEW.state->'history'), 0) / 2;
+    NEW.slots_filled_count := COALESCE((
+        SELECT COUNT(*)
+        FROM jsonb_each(NEW.state->'slots') slot
+        WHERE (slot.value->>'confidence')::float >= 0.7
+    ), 0);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_sessions_list_counts ON sessions;
+CREATE TRIGGER trg_sessions_list_counts
+    BEFORE INSERT OR UPDATE OF state ON sessions
+    FOR EACH ROW EXECUTE FUNCTION sessions_update_list_counts();
+
+-- Backfill existing rows (SET state = state fires the trigger)
+UPDATE sessions SET state = state;
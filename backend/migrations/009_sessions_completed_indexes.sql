@@ -0,0 +1,14 @@
+-- Migration: Partial indexes for the completed-session list
+-- Version: 2026-08-29
+-- The expert-review list defaults to completed_only=true; partial
+-- indexes over completed sessions keep the keyset scan ordered and
+-- skip in-progress rows entirely.
+
+CREATE INDEX IF NOT EXISTS idx_sessions_completed_created_id
+    ON sessions (created_at DESC, session_id DESC)
+    WHERE completed_at IS NOT NULL;
+
+-- Language-filtered variant of the same listing
+CREATE INDEX IF NOT EXISTS idx_sessions_lang_completed_created
+    ON sessions (language, created_at DESC, session_id DESC)
+    WHERE completed_at IS NOT NULL;
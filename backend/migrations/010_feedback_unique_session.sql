@@ -0,0 +1,10 @@
+-- Migration: One feedback row per session
+--
+-- submit_feedback now relies on ON CONFLICT (session_id) to reject
+-- duplicates in the same statement that inserts. The unique index
+-- enforces the invariant the endpoint previously checked with an
+-- extra SELECT, and supersedes the plain session_id index.
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_feedback_session_id ON feedback(session_id);
+
+DROP INDEX IF EXISTS idx_feedback_session_id;